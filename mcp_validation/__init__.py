@@ -28,6 +28,7 @@ from .reporting.json_report import JSONReporter
 
 # Validator framework
 from .validators.base import BaseValidator
+from .validators.registry import close_shared_session
 
 __version__ = "2.0.0"
 
@@ -98,4 +99,7 @@ async def validate_server(
         config_manager.set_active_profile(profile_name)
 
     orchestrator = MCPValidationOrchestrator(config_manager)
-    return await orchestrator.validate_server(command_args, env_vars, profile_name)
+    try:
+        return await orchestrator.validate_server(command_args, env_vars, profile_name)
+    finally:
+        await close_shared_session()
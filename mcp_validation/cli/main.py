@@ -5,10 +5,17 @@ import asyncio
 import sys
 from typing import Dict, List, Optional
 
-from ..config.settings import ConfigurationManager, load_config_from_env
+try:
+    import uvloop
+except ImportError:  # uvloop is an optional speedup (not available on Windows)
+    uvloop = None
+
+from ..config.settings import ConfigurationManager, ValidatorConfig, load_config_from_env
 from ..core.validator import MCPValidationOrchestrator
 from ..reporting.console import ConsoleReporter, print_profile_info, print_validator_info
 from ..reporting.json_report import JSONReporter
+from ..validators.container import CONTAINER_RUNTIMES as _CONTAINER_RUNTIMES
+from ..validators.registry import close_shared_session
 
 
 def parse_env_args(env_args: List[str]) -> Dict[str, str]:
@@ -53,19 +60,19 @@ def detect_runtime_command(command_args: List[str]) -> Optional[str]:
         return 'node'
     
     # Check for container run patterns
-    if len(command_args) >= 2 and first_command in ['docker', 'podman'] and command_args[1] == 'run':
+    if len(command_args) >= 2 and first_command in _CONTAINER_RUNTIMES and command_args[1] == 'run':
         return first_command
     
     return None
 
 
 def is_container_runtime_command(command_args: List[str]) -> bool:
-    """Check if command is a container runtime command (docker/podman run)."""
+    """Check if command is a container runtime command (docker/podman/nerdctl run)."""
     if not command_args or len(command_args) < 3:
         return False
     
     return (
-        command_args[0] in ['docker', 'podman'] 
+        command_args[0] in _CONTAINER_RUNTIMES
         and command_args[1] == 'run'
     )
 
@@ -226,7 +233,6 @@ async def main():
         if args.repo_url:
             # Add repo validators to profile if not already present
             if "repo_availability" not in active_profile.validators:
-                from ..config.settings import ValidatorConfig
                 active_profile.validators["repo_availability"] = ValidatorConfig(
                     enabled=True, required=True, timeout=30.0,
                     parameters={"repo_url": args.repo_url, "clone_timeout": 30.0}
@@ -236,7 +242,6 @@ async def main():
                 active_profile.validators["repo_availability"].parameters["repo_url"] = args.repo_url
 
             if "license" not in active_profile.validators:
-                from ..config.settings import ValidatorConfig
                 active_profile.validators["license"] = ValidatorConfig(
                     enabled=True, required=True, timeout=30.0,
                     parameters={"repo_url": args.repo_url, "clone_timeout": 30.0}
@@ -250,7 +255,6 @@ async def main():
         if runtime_command:
             # Add runtime validators to profile if not already present
             if "runtime_exists" not in active_profile.validators:
-                from ..config.settings import ValidatorConfig
                 active_profile.validators["runtime_exists"] = ValidatorConfig(
                     enabled=True, required=True, timeout=10.0,
                     parameters={"runtime_command": runtime_command}
@@ -260,7 +264,6 @@ async def main():
                 active_profile.validators["runtime_exists"].parameters["runtime_command"] = runtime_command
 
             if "runtime_executable" not in active_profile.validators:
-                from ..config.settings import ValidatorConfig
                 active_profile.validators["runtime_executable"] = ValidatorConfig(
                     enabled=True, required=True, timeout=10.0,
                     parameters={"runtime_command": runtime_command, "execution_timeout": 10.0}
@@ -273,7 +276,6 @@ async def main():
         if is_container_runtime_command(args.command):
             # Add container UBI validator
             if "container_ubi" not in active_profile.validators:
-                from ..config.settings import ValidatorConfig
                 active_profile.validators["container_ubi"] = ValidatorConfig(
                     enabled=True, required=False, timeout=60.0,
                     parameters={"warn_only_for_non_ubi": True}
@@ -286,7 +288,6 @@ async def main():
 
             # Add container version validator  
             if "container_version" not in active_profile.validators:
-                from ..config.settings import ValidatorConfig
                 active_profile.validators["container_version"] = ValidatorConfig(
                     enabled=True, required=False, timeout=30.0,
                     parameters={}
@@ -319,9 +320,15 @@ async def main():
         print()
 
         # Run validation
-        session = await orchestrator.validate_server(
-            command_args=args.command, env_vars=env_vars, profile_name=args.profile, debug=args.debug
-        )
+        try:
+            session = await orchestrator.validate_server(
+                command_args=args.command,
+                env_vars=env_vars,
+                profile_name=args.profile,
+                debug=args.debug,
+            )
+        finally:
+            await close_shared_session()
 
         # Display results
         console_reporter = ConsoleReporter(verbose=args.verbose)
@@ -354,8 +361,10 @@ async def main():
 
 def cli_main():
     """Synchronous entry point for CLI script."""
+    # uvloop.run() creates the loop directly; event loop policies are deprecated
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        exit_code = asyncio.run(main())
+        exit_code = run(main())
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n🛑 Validation interrupted")
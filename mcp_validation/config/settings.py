@@ -1,10 +1,11 @@
 """Configuration management for MCP validation."""
 
-import json
 import os
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ..utils import fastjson
+
 
 @dataclass
 class ValidatorConfig:
@@ -115,37 +116,43 @@ class ConfigurationManager:
         if config_file and os.path.exists(config_file):
             self.load_config(config_file)
 
+    @classmethod
+    def from_dict(cls, config_data: Dict[str, Any]) -> "ConfigurationManager":
+        """Create a manager from already parsed configuration data."""
+        manager = cls()
+        manager.load_dict(config_data)
+        return manager
+
     def load_config(self, config_file: str) -> None:
         """Load configuration from JSON file."""
         try:
-            with open(config_file) as f:
-                config_data = json.load(f)
-
-            # Load custom profiles
-            if "profiles" in config_data:
-                for profile_name, profile_data in config_data["profiles"].items():
-                    validators = {}
-                    for validator_name, validator_data in profile_data.get(
-                        "validators", {}
-                    ).items():
-                        validators[validator_name] = ValidatorConfig(**validator_data)
-
-                    self.profiles[profile_name] = ValidationProfile(
-                        name=profile_name,
-                        description=profile_data.get("description", ""),
-                        validators=validators,
-                        global_timeout=profile_data.get("global_timeout", 30.0),
-                        continue_on_failure=profile_data.get("continue_on_failure", True),
-                        parallel_execution=profile_data.get("parallel_execution", False),
-                    )
-
-            # Set active profile
-            if "active_profile" in config_data:
-                self.active_profile = config_data["active_profile"]
-
+            with open(config_file, "rb") as f:
+                self.load_dict(fastjson.loads(f.read()))
         except Exception as e:
             raise ValueError(f"Failed to load configuration from {config_file}: {e}") from e
 
+    def load_dict(self, config_data: Dict[str, Any]) -> None:
+        """Load configuration from a dict in the config file format."""
+        # Load custom profiles
+        if "profiles" in config_data:
+            for profile_name, profile_data in config_data["profiles"].items():
+                validators = {}
+                for validator_name, validator_data in profile_data.get("validators", {}).items():
+                    validators[validator_name] = ValidatorConfig(**validator_data)
+
+                self.profiles[profile_name] = ValidationProfile(
+                    name=profile_name,
+                    description=profile_data.get("description", ""),
+                    validators=validators,
+                    global_timeout=profile_data.get("global_timeout", 30.0),
+                    continue_on_failure=profile_data.get("continue_on_failure", True),
+                    parallel_execution=profile_data.get("parallel_execution", False),
+                )
+
+        # Set active profile
+        if "active_profile" in config_data:
+            self.active_profile = config_data["active_profile"]
+
     def save_config(self, config_file: str) -> None:
         """Save current configuration to JSON file."""
         config_data = {"active_profile": self.active_profile, "profiles": {}}
@@ -169,8 +176,9 @@ class ConfigurationManager:
                     "parallel_execution": profile.parallel_execution,
                 }
 
-        with open(config_file, "w") as f:
-            json.dump(config_data, f, indent=2)
+        # One buffered write instead of json.dump's many small ones
+        with open(config_file, "wb") as f:
+            f.write(fastjson.dumps(config_data, indent=True))
 
     def get_active_profile(self) -> ValidationProfile:
         """Get the currently active validation profile."""
@@ -2,7 +2,9 @@
 
 import asyncio
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
+
+from ..utils import fastjson
 
 
 class JSONRPCTransport:
@@ -31,10 +33,10 @@ class JSONRPCTransport:
             notification["params"] = params
         return json.dumps(notification) + "\n"
 
-    def parse_response(self, response_line: str) -> Dict[str, Any]:
-        """Parse a JSON-RPC response line."""
+    def parse_response(self, response_line: Union[bytes, str]) -> Dict[str, Any]:
+        """Parse a JSON-RPC response line; raw bytes from the server are parsed directly."""
         try:
-            return json.loads(response_line.strip())
+            return fastjson.loads(response_line.strip())
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON response: {e}") from e
 
@@ -53,7 +55,7 @@ class JSONRPCTransport:
     async def read_response(self, timeout: float = 5.0) -> Dict[str, Any]:
         """Read and parse a JSON-RPC response."""
         response_line = await asyncio.wait_for(self.process.stdout.readline(), timeout=timeout)
-        return self.parse_response(response_line.decode())
+        return self.parse_response(response_line)
 
     async def send_and_receive(
         self, method: str, params: Optional[Dict[str, Any]] = None, timeout: float = 5.0
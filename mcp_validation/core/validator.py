@@ -2,23 +2,29 @@
 
 import asyncio
 import os
+import sys
 import time
-from typing import Any, Dict, List, Optional, Type
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
 
 from ..config.settings import ConfigurationManager, ValidationProfile
+from ..utils import debug as _debug
 from ..utils.debug import (
     log_execution_start, 
     log_execution_step, 
     log_execution_result,
-    log_validator_progress,
     log_validation_summary,
     debug_log,
     set_debug_enabled
 )
 from ..validators.base import BaseValidator, ValidationContext, ValidatorResult
+from ..validators.container import CONTAINER_RUNTIMES
 from .result import ValidationSession
 from .transport import JSONRPCTransport
 
+if TYPE_CHECKING:
+    import aiohttp
+
 
 def _inject_container_env_vars(command_args: List[str], env_vars: Dict[str, str]) -> List[str]:
     """Inject environment variables as -e options for container commands."""
@@ -26,7 +32,7 @@ def _inject_container_env_vars(command_args: List[str], env_vars: Dict[str, str]
         return command_args
     
     # Check if this is a container run command
-    if command_args[0] not in ['docker', 'podman'] or command_args[1] != 'run':
+    if command_args[0] not in CONTAINER_RUNTIMES or command_args[1] != 'run':
         return command_args
     
     # Find insertion point (after 'run' but before the image name)
@@ -79,12 +85,23 @@ class ValidatorRegistry:
 
     def __init__(self):
         self._validators: Dict[str, Type[BaseValidator]] = {}
+        self._frozen: Optional[MappingProxyType] = None
 
     def register(self, validator_class: Type[BaseValidator]) -> None:
         """Register a validator class."""
         # Create temporary instance to get name
         temp_instance = validator_class()
         self._validators[temp_instance.name] = validator_class
+        if self._frozen is not None:
+            # Keep the read-only lookup view in sync with late registrations
+            self.freeze()
+
+    def freeze(self) -> None:
+        """Snapshot registered validators into a read-only, interned lookup table."""
+        self._frozen = MappingProxyType(
+            {sys.intern(name): cls for name, cls in self._validators.items()}
+        )
+        self.get_validator = self._frozen.get
 
     def get_validator(self, name: str) -> Optional[Type[BaseValidator]]:
         """Get validator class by name."""
@@ -105,8 +122,14 @@ class ValidatorRegistry:
 class MCPValidationOrchestrator:
     """Orchestrates MCP server validation using configurable validators."""
 
-    def __init__(self, config_manager: ConfigurationManager):
+    def __init__(
+        self,
+        config_manager: ConfigurationManager,
+        http_session: Optional["aiohttp.ClientSession"] = None,
+    ):
         self.config_manager = config_manager
+        # Optional caller-owned session handed to validators through the context
+        self.http_session = http_session
         self.registry = ValidatorRegistry()
         self._register_builtin_validators()
 
@@ -147,6 +170,8 @@ class MCPValidationOrchestrator:
             # Handle missing validators gracefully
             print(f"Warning: Some validators not available: {e}")
 
+        self.registry.freeze()
+
     def register_validator(self, validator_class: Type[BaseValidator]) -> None:
         """Register a custom validator."""
         self.registry.register(validator_class)
@@ -179,7 +204,8 @@ class MCPValidationOrchestrator:
 
         try:
             # Log execution start with full context
-            log_execution_start(command_args, env_vars)
+            if debug:
+                log_execution_start(command_args, env_vars)
             
             # Start MCP server process
             log_execution_step("Preparing environment")
@@ -187,16 +213,20 @@ class MCPValidationOrchestrator:
             
             # For container commands, inject environment variables as -e options
             final_command_args = command_args
-            if env_vars and len(command_args) >= 2 and command_args[0] in ['docker', 'podman'] and command_args[1] == 'run':
+            if env_vars and len(command_args) >= 2 and command_args[0] in CONTAINER_RUNTIMES and command_args[1] == 'run':
                 final_command_args = _inject_container_env_vars(command_args, env_vars)
                 log_execution_step(f"Injected {len(env_vars)} environment variables as -e options for container")
-                log_execution_step("Modified command", f"Command: {' '.join(final_command_args)}")
+                log_execution_step(
+                    "Modified command", lambda: f"Command: {' '.join(final_command_args)}"
+                )
             elif env_vars:
                 # For non-container commands, use environment variables in subprocess environment
                 env.update(env_vars)
                 log_execution_step(f"Added {len(env_vars)} environment variables to subprocess environment")
 
-            log_execution_step("Creating subprocess", f"Command: {' '.join(final_command_args)}")
+            log_execution_step(
+                "Creating subprocess", lambda: f"Command: {' '.join(final_command_args)}"
+            )
             process = await asyncio.create_subprocess_exec(
                 *final_command_args,
                 stdin=asyncio.subprocess.PIPE,
@@ -209,21 +239,22 @@ class MCPValidationOrchestrator:
 
             # Create transport and validation context
             log_execution_step("Setting up validation context")
-            transport = JSONRPCTransport(process)
             context = ValidationContext(
                 process=process,
                 server_info={},
                 capabilities={},
                 timeout=profile.global_timeout,
                 command_args=final_command_args,
+                transport=JSONRPCTransport(process),
+                fail_fast=not profile.continue_on_failure,
+                http_session=self.http_session,
             )
-            context.transport = transport
 
             # Create and configure validators
             log_execution_step("Creating validators", f"Profile: {profile.name}")
             validators = self._create_validators(profile)
             log_execution_step(f"Configured {len(validators)} validators", 
-                             f"Names: {[v.name for v in validators]}")
+                             lambda: f"Names: {[v.name for v in validators]}")
 
             # Execute validators
             log_execution_step("Starting validation", 
@@ -347,9 +378,17 @@ class MCPValidationOrchestrator:
         validators: List[BaseValidator],
         context: ValidationContext,
         profile: ValidationProfile,
+        results: Optional[List[ValidatorResult]] = None,
     ) -> List[ValidatorResult]:
-        """Execute validators sequentially."""
-        results = []
+        """Execute validators sequentially.
+
+        Results are appended to ``results`` as each validator finishes, so a
+        caller that cancels the run keeps the ones already produced.
+        """
+        # Resolved per run: set_debug_enabled() swaps in a no-op when debug is off
+        log_validator_progress = _debug.log_validator_progress
+        if results is None:
+            results = []
         total_validators = len(validators)
 
         for i, validator in enumerate(validators, 1):
@@ -420,10 +459,94 @@ class MCPValidationOrchestrator:
         context: ValidationContext,
         profile: ValidationProfile,
     ) -> List[ValidatorResult]:
-        """Execute validators in parallel (where possible)."""
-        # For now, implement sequential execution
-        # Parallel execution would need more sophisticated dependency handling
-        return await self._execute_validators_sequential(validators, context, profile)
+        """Execute validators in parallel (where possible).
+
+        Validators linked by dependencies form a chain that runs sequentially;
+        everything that talks to the server depends on ``protocol``, so its
+        stdio transport is only ever used by one validator at a time. The
+        chains themselves run concurrently. Results are returned in the same
+        order as sequential execution.
+        """
+        chains = self._group_validators_by_dependencies(validators)
+        if len(chains) <= 1:
+            return await self._execute_validators_sequential(validators, context, profile)
+
+        log_execution_step(
+            "Running validator chains concurrently",
+            lambda: " | ".join(" -> ".join(v.name for v in chain) for chain in chains),
+        )
+        required = {v.name for v in validators if v.config.get("required")}
+        chain_results: List[List[ValidatorResult]] = [[] for _ in chains]
+
+        async def run_chain(chain: List[BaseValidator], results: List[ValidatorResult]) -> None:
+            try:
+                await self._execute_validators_sequential(chain, context, profile, results)
+            except Exception as e:
+                # Report the failure against the validator that was running
+                finished = {result.validator_name for result in results}
+                validator = next((v for v in chain if v.name not in finished), chain[-1])
+                results.append(
+                    ValidatorResult(
+                        validator_name=validator.name,
+                        passed=False,
+                        errors=[f"Validator execution failed: {str(e)}"],
+                        warnings=[],
+                        data={},
+                        execution_time=0.0,
+                    )
+                )
+
+        # With fail-fast, a required failure in one chain cancels the others
+        pending = {
+            asyncio.ensure_future(run_chain(chain, results))
+            for chain, results in zip(chains, chain_results)
+        }
+        try:
+            while pending:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if not profile.continue_on_failure and any(
+                    result.validator_name in required and not result.passed
+                    for results in chain_results
+                    for result in results
+                ):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        order = {validator.name: i for i, validator in enumerate(validators)}
+        results = [result for results in chain_results for result in results]
+        results.sort(key=lambda result: order[result.validator_name])
+        return results
+
+    @staticmethod
+    def _group_validators_by_dependencies(
+        validators: List[BaseValidator],
+    ) -> List[List[BaseValidator]]:
+        """Split validators into chains connected by dependencies, keeping their order.
+
+        Validators are linked through the names they declare even when that
+        dependency is not part of the run, so with ``protocol`` disabled the
+        validators that need the server's transport still share one chain.
+        """
+        parent = {validator.name: validator.name for validator in validators}
+
+        def find(name: str) -> str:
+            while parent[name] != name:
+                parent[name] = parent[parent[name]]
+                name = parent[name]
+            return name
+
+        for validator in validators:
+            for dep_name in validator.dependencies:
+                parent.setdefault(dep_name, dep_name)
+                parent[find(dep_name)] = find(validator.name)
+
+        chains: Dict[str, List[BaseValidator]] = {}
+        for validator in validators:
+            chains.setdefault(find(validator.name), []).append(validator)
+        return list(chains.values())
 
     def _determine_overall_success(
         self, validator_results: List[ValidatorResult], profile: ValidationProfile
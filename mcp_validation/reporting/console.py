@@ -10,6 +10,16 @@ class ConsoleReporter:
 
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
+        # Validator name -> data reporter, replacing a chain of string compares
+        self._data_reporters = {
+            "protocol": self._report_protocol_data,
+            "capabilities": self._report_capabilities_data,
+            "ping": self._report_ping_data,
+            "errors": self._report_errors_data,
+            "security": self._report_security_data,
+            "container_ubi": self._report_container_ubi_data,
+            "container_version": self._report_container_version_data,
+        }
 
     def report_session(self, session: ValidationSession) -> None:
         """Report a complete validation session to console."""
@@ -40,20 +50,9 @@ class ConsoleReporter:
         )
 
         # Report validator-specific data
-        if result.validator_name == "protocol":
-            self._report_protocol_data(result.data)
-        elif result.validator_name == "capabilities":
-            self._report_capabilities_data(result.data)
-        elif result.validator_name == "ping":
-            self._report_ping_data(result.data)
-        elif result.validator_name == "errors":
-            self._report_errors_data(result.data)
-        elif result.validator_name == "security":
-            self._report_security_data(result.data)
-        elif result.validator_name == "container_ubi":
-            self._report_container_ubi_data(result.data)
-        elif result.validator_name == "container_version":
-            self._report_container_version_data(result.data)
+        report_data = self._data_reporters.get(result.validator_name)
+        if report_data is not None:
+            report_data(result.data)
 
         # Report errors and warnings if verbose or validator failed
         if result.errors and (self.verbose or not result.passed):
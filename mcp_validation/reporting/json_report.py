@@ -1,10 +1,10 @@
 """JSON reporting for MCP validation results."""
 
 import datetime
-import json
 from typing import Any, Dict, List, Optional
 
-from ..core.result import ValidationSession, ValidatorResult
+from ..core.result import ValidationSession
+from ..utils import fastjson
 
 
 class JSONReporter:
@@ -17,60 +17,66 @@ class JSONReporter:
         env_vars: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Generate a comprehensive JSON report."""
+        if not session.validator_results:
+            return self._empty_report(session, command_args, env_vars)
 
-        # Extract aggregated data
-        server_info = {}
-        capabilities = {}
-        tools = []
-        prompts = []
-        resources = []
-        ping_result = None
-        error_compliance = None
-        security_analysis = {}
-        repo_availability = None
-        license_validation = None
-        runtime_exists = None
-        runtime_executable = None
-
+        # Single pass: latest data payload per validator, pass count and formatted results
+        data_by_validator: Dict[str, Dict[str, Any]] = {}
+        formatted_results = []
+        validators_passed = 0
         for result in session.validator_results:
-            if result.validator_name == "protocol":
-                server_info = result.data.get("server_info", {})
-                capabilities = result.data.get("capabilities", {})
-            elif result.validator_name == "capabilities":
-                tools = result.data.get("tools", [])
-                prompts = result.data.get("prompts", [])
-                resources = result.data.get("resources", [])
-            elif result.validator_name == "ping":
-                ping_result = result.data
-            elif result.validator_name == "errors":
-                error_compliance = result.data
-            elif result.validator_name == "security":
-                security_analysis = result.data
-            elif result.validator_name == "repo_availability":
-                repo_availability = result.data
-            elif result.validator_name == "license":
-                license_validation = result.data
-            elif result.validator_name == "runtime_exists":
-                runtime_exists = result.data
-            elif result.validator_name == "runtime_executable":
-                runtime_executable = result.data
+            data_by_validator[result.validator_name] = result.data
+            validators_passed += result.passed
+            errors = result.errors
+            warnings = result.warnings
+            formatted_results.append(
+                {
+                    "validator_name": result.validator_name,
+                    "passed": result.passed,
+                    "execution_time_seconds": result.execution_time,
+                    "error_count": len(errors),
+                    "warning_count": len(warnings),
+                    "errors": errors,
+                    "warnings": warnings,
+                    "data": result.data,
+                }
+            )
+
+        protocol_data = data_by_validator.get("protocol", {})
+        server_info = protocol_data.get("server_info", {})
+        capabilities = protocol_data.get("capabilities", {})
+
+        capabilities_data = data_by_validator.get("capabilities", {})
+        tools = capabilities_data.get("tools", [])
+        prompts = capabilities_data.get("prompts", [])
+        resources = capabilities_data.get("resources", [])
+
+        ping_result = data_by_validator.get("ping")
+        error_compliance = data_by_validator.get("errors")
+        security_analysis = data_by_validator.get("security", {})
+        repo_availability = data_by_validator.get("repo_availability")
+        license_validation = data_by_validator.get("license")
+        runtime_exists = data_by_validator.get("runtime_exists")
+        runtime_executable = data_by_validator.get("runtime_executable")
+
+        # Empty stand-ins so absent validators need no per-field None checks
+        ping = ping_result or {}
+        compliance = error_compliance or {}
+        repo = repo_availability or {}
+        license_data = license_validation or {}
+        runtime = runtime_exists or {}
+        executable = runtime_executable or {}
 
         # Build comprehensive report
         report = {
-            "report_metadata": {
-                "generated_at": datetime.datetime.now().isoformat(),
-                "validator_version": "2.0.0",
-                "profile_used": session.profile_name,
-                "command": " ".join(command_args),
-                "environment_variables": env_vars or {},
-            },
+            "report_metadata": self._report_metadata(session, command_args, env_vars),
             "validation_summary": {
                 "overall_success": session.overall_success,
                 "execution_time_seconds": session.execution_time,
                 "total_errors": len(session.errors),
                 "total_warnings": len(session.warnings),
-                "validators_run": len(session.validator_results),
-                "validators_passed": sum(1 for r in session.validator_results if r.passed),
+                "validators_run": len(formatted_results),
+                "validators_passed": validators_passed,
             },
             "server_information": {
                 "server_info": server_info,
@@ -81,31 +87,19 @@ class JSONReporter:
                     "resources": {"count": len(resources), "names": resources},
                 },
             },
-            "validator_results": [
-                self._format_validator_result(result) for result in session.validator_results
-            ],
+            "validator_results": formatted_results,
             "optional_features": {
                 "ping_protocol": {
                     "tested": ping_result is not None,
-                    "supported": ping_result.get("supported", False) if ping_result else False,
-                    "response_time_ms": (
-                        ping_result.get("response_time_ms") if ping_result else None
-                    ),
-                    "error": ping_result.get("error") if ping_result else None,
+                    "supported": ping.get("supported", False),
+                    "response_time_ms": ping.get("response_time_ms"),
+                    "error": ping.get("error"),
                 },
                 "error_compliance": {
                     "tested": error_compliance is not None,
-                    "invalid_method_test": (
-                        error_compliance.get("invalid_method_test", {}) if error_compliance else {}
-                    ),
-                    "malformed_request_test": (
-                        error_compliance.get("malformed_request_test", {})
-                        if error_compliance
-                        else {}
-                    ),
-                    "compliance_issues": (
-                        error_compliance.get("compliance_issues", []) if error_compliance else []
-                    ),
+                    "invalid_method_test": compliance.get("invalid_method_test", {}),
+                    "malformed_request_test": compliance.get("malformed_request_test", {}),
+                    "compliance_issues": compliance.get("compliance_issues", []),
                 },
             },
             "security_analysis": {
@@ -119,38 +113,40 @@ class JSONReporter:
             "repository_validation": {
                 "repo_availability": {
                     "executed": repo_availability is not None,
-                    "repo_url": repo_availability.get("repo_url") if repo_availability else None,
-                    "is_git_repo": repo_availability.get("is_git_repo", False) if repo_availability else False,
-                    "clone_successful": repo_availability.get("clone_successful", False) if repo_availability else False,
-                    "has_readme": repo_availability.get("has_readme", False) if repo_availability else False,
-                    "has_license": repo_availability.get("has_license", False) if repo_availability else False,
-                    "readme_files": repo_availability.get("readme_files", []) if repo_availability else [],
-                    "license_files": repo_availability.get("license_files", []) if repo_availability else [],
+                    "repo_url": repo.get("repo_url"),
+                    "is_git_repo": repo.get("is_git_repo", False),
+                    "clone_successful": repo.get("clone_successful", False),
+                    "has_readme": repo.get("has_readme", False),
+                    "has_license": repo.get("has_license", False),
+                    "readme_files": repo.get("readme_files", []),
+                    "license_files": repo.get("license_files", []),
                 },
                 "license_validation": {
                     "executed": license_validation is not None,
-                    "license_detected": license_validation.get("license_detected", False) if license_validation else False,
-                    "license_type": license_validation.get("license_type") if license_validation else None,
-                    "license_acceptable": license_validation.get("license_acceptable", False) if license_validation else False,
-                    "license_files_found": license_validation.get("license_files_found", []) if license_validation else [],
+                    "license_detected": license_data.get("license_detected", False),
+                    "license_type": license_data.get("license_type"),
+                    "license_acceptable": license_data.get("license_acceptable", False),
+                    "license_files_found": license_data.get("license_files_found", []),
                 },
             },
             "runtime_validation": {
                 "runtime_exists": {
                     "executed": runtime_exists is not None,
-                    "runtime_command": runtime_exists.get("runtime_command") if runtime_exists else None,
-                    "runtime_found": runtime_exists.get("runtime_found", False) if runtime_exists else False,
-                    "runtime_path": runtime_exists.get("runtime_path") if runtime_exists else None,
-                    "runtime_version": runtime_exists.get("runtime_version") if runtime_exists else None,
-                    "path_locations": runtime_exists.get("path_locations", []) if runtime_exists else [],
+                    "runtime_command": runtime.get("runtime_command"),
+                    "runtime_found": runtime.get("runtime_found", False),
+                    "runtime_path": runtime.get("runtime_path"),
+                    "runtime_version": runtime.get("runtime_version"),
+                    "path_locations": runtime.get("path_locations", []),
                 },
                 "runtime_executable": {
                     "executed": runtime_executable is not None,
-                    "executable_check_passed": runtime_executable.get("executable_check_passed", False) if runtime_executable else False,
-                    "test_execution_successful": runtime_executable.get("test_execution_successful", False) if runtime_executable else False,
-                    "test_command_used": runtime_executable.get("test_command_used") if runtime_executable else None,
-                    "test_execution_time": runtime_executable.get("test_execution_time", 0) if runtime_executable else 0,
-                    "test_exit_code": runtime_executable.get("test_exit_code") if runtime_executable else None,
+                    "executable_check_passed": executable.get("executable_check_passed", False),
+                    "test_execution_successful": executable.get(
+                        "test_execution_successful", False
+                    ),
+                    "test_command_used": executable.get("test_command_used"),
+                    "test_execution_time": executable.get("test_execution_time", 0),
+                    "test_exit_code": executable.get("test_exit_code"),
                 },
             },
             "issues": {"errors": session.errors, "warnings": session.warnings},
@@ -158,17 +154,42 @@ class JSONReporter:
 
         return report
 
-    def _format_validator_result(self, result: ValidatorResult) -> Dict[str, Any]:
-        """Format a single validator result for JSON output."""
+    def _report_metadata(
+        self,
+        session: ValidationSession,
+        command_args: List[str],
+        env_vars: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        """Build the report_metadata section."""
         return {
-            "validator_name": result.validator_name,
-            "passed": result.passed,
-            "execution_time_seconds": result.execution_time,
-            "error_count": len(result.errors),
-            "warning_count": len(result.warnings),
-            "errors": result.errors,
-            "warnings": result.warnings,
-            "data": result.data,
+            "generated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(
+                timespec="seconds"
+            ),
+            "validator_version": "2.0.0",
+            "profile_used": session.profile_name,
+            "command": " ".join(command_args),
+            "environment_variables": env_vars or {},
+        }
+
+    def _empty_report(
+        self,
+        session: ValidationSession,
+        command_args: List[str],
+        env_vars: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        """Build a minimal report for sessions where no validator ran."""
+        return {
+            "report_metadata": self._report_metadata(session, command_args, env_vars),
+            "validation_summary": {
+                "overall_success": session.overall_success,
+                "execution_time_seconds": session.execution_time,
+                "total_errors": len(session.errors),
+                "total_warnings": len(session.warnings),
+                "validators_run": 0,
+                "validators_passed": 0,
+            },
+            "validator_results": [],
+            "issues": {"errors": session.errors, "warnings": session.warnings},
         }
 
     def save_report(
@@ -181,7 +202,8 @@ class JSONReporter:
         """Generate and save JSON report to file."""
         report = self.generate_report(session, command_args, env_vars)
 
-        with open(filename, "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        # Encode in memory and write once rather than streaming many small writes
+        with open(filename, "wb") as f:
+            f.write(fastjson.dumps(report, indent=True, default=str))
 
         print(f"📋 JSON report saved to: {filename}")
@@ -3,16 +3,23 @@
 import os
 import shlex
 import sys
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Union
 
 # Global debug state - set by CLI argument
 _debug_enabled = False
 
 
 def set_debug_enabled(enabled: bool) -> None:
-    """Set the global debug state."""
-    global _debug_enabled
+    """Set the global debug state.
+
+    Also rebinds the hot-path ``log_validator_progress`` helper to a no-op while
+    debug is disabled, so callers that look it up through this module skip the
+    function body entirely.
+    """
+    global _debug_enabled, log_validator_progress
     _debug_enabled = enabled
+    log_validator_progress = _log_validator_progress if enabled else _noop
 
 
 def debug_log(message: str, level: str = "INFO", category: str = "GENERAL") -> None:
@@ -31,7 +38,6 @@ def is_debug_enabled() -> bool:
 
 def get_timestamp() -> str:
     """Get current timestamp for debug messages."""
-    from datetime import datetime
     return datetime.now().strftime("%H:%M:%S.%f")[:-3]
 
 
@@ -60,6 +66,7 @@ def get_execution_context() -> Dict[str, Any]:
 
 def log_execution_start(command_args: List[str], env_vars: Optional[Dict[str, str]] = None) -> None:
     """Log the start of process execution with full context."""
+    # Bail out before gathering context or walking env_vars
     if not is_debug_enabled():
         return
         
@@ -102,11 +109,18 @@ def log_execution_start(command_args: List[str], env_vars: Optional[Dict[str, st
     debug_log("=" * 80, "INFO", "EXEC")
 
 
-def log_execution_step(step: str, details: str = "") -> None:
-    """Log a step in the execution process."""
+def log_execution_step(step: str, details: Union[str, Callable[[], str]] = "") -> None:
+    """Log a step in the execution process.
+
+    ``details`` may be a zero-argument callable; it is only invoked when debug
+    mode is enabled, so expensive formatting is skipped otherwise.
+    """
     if not is_debug_enabled():
         return
-        
+
+    if callable(details):
+        details = details()
+
     message = f"🔄 {step}"
     if details:
         message += f": {details}"
@@ -146,7 +160,7 @@ def mask_sensitive_value(key: str, value: str) -> str:
     return value
 
 
-def log_validator_progress(validator_name: str, step: str, details: str = "") -> None:
+def _log_validator_progress(validator_name: str, step: str, details: str = "") -> None:
     """Log validator execution progress."""
     if not is_debug_enabled():
         return
@@ -157,6 +171,14 @@ def log_validator_progress(validator_name: str, step: str, details: str = "") ->
     debug_log(message, "INFO", "VALIDATOR")
 
 
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for debug helpers while debug mode is disabled."""
+
+
+# Rebound by set_debug_enabled(); debug is off by default.
+log_validator_progress = _noop
+
+
 def log_validation_summary(total_validators: int, passed: int, failed: int, execution_time: float) -> None:
     """Log validation session summary."""
     if not is_debug_enabled():
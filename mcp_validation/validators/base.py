@@ -2,25 +2,78 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import FrozenInstanceError, dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar
 
+if TYPE_CHECKING:
+    import aiohttp
 
-@dataclass
+    from ..core.transport import JSONRPCTransport
+
+
+_T = TypeVar("_T")
+
+
+def _frozen_setattr(self: Any, name: str, value: Any) -> None:
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self: Any, name: str) -> None:
+    raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+def _with_slots(cls: Type[_T]) -> Type[_T]:
+    """Rebuild a dataclass with ``__slots__``, as ``dataclass(slots=True)`` does on 3.10+.
+
+    Field defaults live in the generated ``__init__``, so the class attributes
+    holding them (which would clash with the slots) are dropped. The frozen
+    ``__setattr__``/``__delattr__`` generated for the original class do not
+    recognise the rebuilt one, so frozen classes get their own.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    if getattr(cls, "__dataclass_params__").frozen:
+        namespace["__setattr__"] = _frozen_setattr
+        namespace["__delattr__"] = _frozen_delattr
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_with_slots
+@dataclass(frozen=True, eq=False)
 class ValidationContext:
-    """Context passed to validators containing process and shared state."""
+    """Context passed to validators containing process and shared state.
+
+    Created once per run and shared by every validator, so its fields are
+    fixed; ``server_info`` and ``capabilities`` are filled in place.
+    """
 
     process: asyncio.subprocess.Process
     server_info: Dict[str, Any]
     capabilities: Dict[str, Any]
     timeout: float = 30.0
     command_args: Optional[List[str]] = None
+    transport: Optional["JSONRPCTransport"] = None
+    # Set when the profile stops at the first failure (continue_on_failure=False)
+    fail_fast: bool = False
+    # HTTP session shared by network validators for the whole run; owned by the caller
+    http_session: Optional["aiohttp.ClientSession"] = None
+    # Registry documents fetched during this run, keyed "<registry type>:<name>", so
+    # validators looking up the same packages reuse them instead of refetching
+    fetch_cache: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
 class ValidatorResult:
     """Result from a validator execution."""
 
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ("validator_name", "passed", "errors", "warnings", "data", "execution_time")
+
     validator_name: str
     passed: bool
     errors: List[str]
@@ -32,8 +85,11 @@ class ValidatorResult:
 class BaseValidator(ABC):
     """Base class for all MCP validators."""
 
+    # Subclasses declare their own __slots__ too; otherwise they get a __dict__
+    __slots__ = ("config", "enabled", "required")
+
     def __init__(self, config: Dict[str, Any] = None):
-        self.config = config or {}
+        self.config = {} if config is None else config
         self.enabled = self.config.get("enabled", True)
         self.required = self.config.get("required", False)
 
@@ -10,6 +10,8 @@ from .base import BaseValidator, ValidationContext, ValidatorResult
 class CapabilitiesValidator(BaseValidator):
     """Validates MCP server capabilities."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "capabilities"
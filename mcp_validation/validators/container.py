@@ -1,12 +1,14 @@
 """Container image validation for MCP servers."""
 
 import asyncio
+import functools
 import json
 import re
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from .base import BaseValidator, ValidationContext, ValidatorResult
+from ..utils import fastjson
 from ..utils.debug import debug_log as _debug_log
 
 
@@ -15,9 +17,112 @@ def debug_log(message: str, level: str = "INFO") -> None:
     _debug_log(message, level, "CONTAINER")
 
 
+# Docker-compatible CLIs whose `<runtime> run` launches a container image
+CONTAINER_RUNTIMES = frozenset(("docker", "podman", "nerdctl"))
+
+# UBI detection patterns, compiled once at import
+_UBI_LABEL_RE = re.compile(r"redhat|ubi|rhel", re.IGNORECASE)
+_UBI_ENV_RE = re.compile(r"redhat|ubi", re.IGNORECASE)
+_UBI_TEXT_RE = re.compile(
+    r"ubi\d*"  # ubi8, ubi9, ubi10, etc.
+    r"|universal.base.image"
+    r"|red.hat.universal.base.image"
+)
+_RHEL_VERSION_PATTERNS = (
+    re.compile(r"rhel\s*(\d+)"),
+    re.compile(r"ubi(\d+)"),
+    re.compile(r"red.hat.enterprise.linux.(\d+)"),
+)
+
+
+# `run` options whose value is the following argument
+_OPTIONS_WITH_VALUES = frozenset((
+    "-v", "--volume", "-e", "--env", "-p", "--port", "--name",
+    "-w", "--workdir", "-u", "--user", "--entrypoint", "--hostname",
+    "--restart", "--memory", "--cpus", "--network", "--label",
+))
+
+
+def _is_container_command(command_args: Sequence[str]) -> bool:
+    """Check if command is a container runtime command."""
+    if not command_args:
+        return False
+
+    # Must be a run command with an image
+    return (
+        command_args[0] in CONTAINER_RUNTIMES
+        and len(command_args) >= 3
+        and command_args[1] == "run"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_image_name(command_args: Tuple[str, ...]) -> Optional[str]:
+    """Extract the image from ``<runtime> run [options] IMAGE [command]``.
+
+    Cached because every container validator in a run parses the same argv.
+    """
+    if not _is_container_command(command_args):
+        return None
+
+    # Skip run and look for the image (skip options that start with -)
+    i = 2
+    while i < len(command_args):
+        arg = command_args[i]
+
+        if not arg.startswith("-"):
+            # First non-option argument should be the image
+            return arg
+
+        if arg in _OPTIONS_WITH_VALUES:
+            # Skip the option and its value
+            i += 2
+        else:
+            # Option without value (like --rm, -i) or with an inline value (--env=VAR=value)
+            i += 1
+
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_image_name(image_name: str) -> Dict[str, Any]:
+    """Split an image reference into registry, repository and tag."""
+    result = {
+        "image_registry": None,
+        "image_repository": None,
+        "image_tag": "latest",
+        "full_image_name": image_name,
+    }
+
+    # Split by tag separator
+    if ":" in image_name:
+        image_part, tag_part = image_name.rsplit(":", 1)
+        result["image_tag"] = tag_part
+    else:
+        image_part = image_name
+
+    # Split registry and repository
+    if "/" in image_part:
+        parts = image_part.split("/")
+        if "." in parts[0] or ":" in parts[0]:  # Likely a registry
+            result["image_registry"] = parts[0]
+            result["image_repository"] = "/".join(parts[1:])
+        else:
+            result["image_repository"] = image_part
+    else:
+        result["image_repository"] = image_part
+
+    return result
+
+
 class ContainerUBIValidator(BaseValidator):
     """Validates that container images are based on UBI (Universal Base Image) with RHEL 9 or 10."""
 
+    __slots__ = ()
+
+    # Successful inspections keyed by (runtime, image); pull + inspect is slow
+    _inspect_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
     @property
     def name(self) -> str:
         return "container_ubi"
@@ -39,60 +144,13 @@ class ContainerUBIValidator(BaseValidator):
 
     def _is_container_command(self, command_args: List[str]) -> bool:
         """Check if command is a container runtime command."""
-        if not command_args:
-            return False
-        
-        first_cmd = command_args[0]
-        if first_cmd in ["docker", "podman"]:
-            # Check if it's a run command with an image
-            if len(command_args) >= 3 and command_args[1] == "run":
-                return True
-        
-        return False
+        return _is_container_command(command_args)
 
     def _extract_image_name(self, command_args: List[str]) -> Optional[str]:
         """Extract container image name from command arguments."""
-        if not self._is_container_command(command_args):
-            return None
-        
-        # Find the image name in docker/podman run command
-        # Format: docker/podman run [options] IMAGE [command]
-        runtime = command_args[0]  # docker or podman
-        if len(command_args) < 3 or command_args[1] != "run":
+        if not command_args:
             return None
-        
-        # Options that take values
-        options_with_values = {
-            "-v", "--volume", "-e", "--env", "-p", "--port", "--name", 
-            "-w", "--workdir", "-u", "--user", "--entrypoint", "--hostname",
-            "--restart", "--memory", "--cpus", "--network", "--label"
-        }
-        
-        # Skip run and look for the image (skip options that start with -)
-        i = 2
-        while i < len(command_args):
-            arg = command_args[i]
-            
-            # Skip options and their values
-            if arg.startswith("-"):
-                # Check if this option takes a value
-                if arg in options_with_values:
-                    # Skip the option and its value
-                    i += 2
-                    continue
-                elif "=" in arg:
-                    # Option with value in same argument (like --env=VAR=value)
-                    i += 1
-                    continue
-                else:
-                    # Option without value (like --rm, -i, etc.)
-                    i += 1
-                    continue
-            else:
-                # First non-option argument should be the image
-                return arg
-            
-        return None
+        return _extract_image_name(tuple(command_args))
 
     async def validate(self, context: ValidationContext) -> ValidatorResult:
         """Execute UBI base image validation."""
@@ -193,8 +251,42 @@ class ContainerUBIValidator(BaseValidator):
             execution_time=execution_time,
         )
 
+    async def validate_batch(
+        self, contexts: Sequence[ValidationContext], concurrency: int = 8
+    ) -> List[ValidatorResult]:
+        """Validate several container commands, overlapping their pull + inspect calls.
+
+        At most ``concurrency`` validations run at once; results are returned in
+        the order of ``contexts``.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _validate_one(context: ValidationContext) -> ValidatorResult:
+            async with semaphore:
+                return await self.validate(context)
+
+        return list(await asyncio.gather(*(_validate_one(context) for context in contexts)))
+
+    @classmethod
+    def clear_inspect_cache(cls) -> None:
+        """Forget cached image inspections."""
+        cls._inspect_cache.clear()
+
     async def _inspect_image(self, runtime: str, image_name: str) -> Dict[str, Any]:
-        """Inspect container image to get metadata."""
+        """Inspect container image to get metadata, reusing earlier successful inspections."""
+        key = (runtime, image_name)
+        cached = self._inspect_cache.get(key)
+        if cached is not None:
+            debug_log(f"Using cached inspection for {image_name}")
+            return dict(cached)
+
+        result = await self._run_inspect(runtime, image_name)
+        if result["image_inspected"]:
+            self._inspect_cache[key] = dict(result)
+        return result
+
+    async def _run_inspect(self, runtime: str, image_name: str) -> Dict[str, Any]:
+        """Pull and inspect the image with the container runtime."""
         result = {
             "image_inspected": False,
             "inspection_output": None,
@@ -226,11 +318,14 @@ class ContainerUBIValidator(BaseValidator):
             stdout, stderr = await asyncio.wait_for(inspect_process.communicate(), timeout=30.0)
 
             if inspect_process.returncode == 0:
-                inspect_data = json.loads(stdout.decode())
+                inspect_data = fastjson.loads(stdout)
                 if inspect_data and len(inspect_data) > 0:
                     image_data = inspect_data[0]
                     result["image_inspected"] = True
-                    result["inspection_output"] = json.dumps(image_data, indent=2)[:2000]  # Limit size
+                    # Limit size; the cut may split a multi-byte character
+                    result["inspection_output"] = (
+                        fastjson.dumps(image_data, indent=True)[:2000].decode("utf-8", "ignore")
+                    )
                     
                     # Extract labels and environment
                     config = image_data.get("Config", {})
@@ -272,21 +367,10 @@ class ContainerUBIValidator(BaseValidator):
         labels = inspection_result.get("image_labels", {})
         env_vars = inspection_result.get("image_env", [])
 
-        # Check labels for UBI indicators
-        ubi_indicators = [
-            "com.redhat.component",
-            "io.openshift.tags",
-            "release",
-            "distribution-scope",
-            "name",
-            "summary",
-            "description"
-        ]
-
         debug_log(f"Checking {len(labels)} labels for UBI indicators")
         
         for label, value in labels.items():
-            if any(indicator in label.lower() for indicator in ["redhat", "ubi", "rhel"]):
+            if _UBI_LABEL_RE.search(label):
                 result["ubi_details"][label] = value
                 debug_log(f"Found UBI-related label: {label}={value}")
 
@@ -302,30 +386,16 @@ class ContainerUBIValidator(BaseValidator):
         elif component:
             result["base_image"] = labels.get("com.redhat.component", "Unknown")
 
-        # Check for UBI patterns
-        ubi_patterns = [
-            r"ubi\d*",  # ubi8, ubi9, ubi10, etc.
-            r"universal.base.image",
-            r"red.hat.universal.base.image"
-        ]
-
         all_text = f"{component} {name} {summary} {description}".lower()
         
-        for pattern in ubi_patterns:
-            if re.search(pattern, all_text):
-                result["is_ubi_based"] = True
-                debug_log(f"UBI pattern matched: {pattern}")
-                break
-
-        # Extract RHEL version
-        version_patterns = [
-            r"rhel\s*(\d+)",
-            r"ubi(\d+)",
-            r"red.hat.enterprise.linux.(\d+)"
-        ]
-
-        for pattern in version_patterns:
-            match = re.search(pattern, all_text)
+        ubi_match = _UBI_TEXT_RE.search(all_text)
+        if ubi_match:
+            result["is_ubi_based"] = True
+            debug_log(f"UBI pattern matched: {ubi_match.group(0)}")
+
+        # Extract RHEL version; patterns are tried in priority order
+        for pattern in _RHEL_VERSION_PATTERNS:
+            match = pattern.search(all_text)
             if match:
                 result["rhel_version"] = match.group(1)
                 debug_log(f"RHEL version detected: {result['rhel_version']}")
@@ -333,7 +403,7 @@ class ContainerUBIValidator(BaseValidator):
 
         # Additional checks in environment variables
         for env_var in env_vars:
-            if "redhat" in env_var.lower() or "ubi" in env_var.lower():
+            if _UBI_ENV_RE.search(env_var):
                 result["ubi_details"]["env_" + env_var.split("=")[0]] = env_var
                 if not result["is_ubi_based"]:
                     result["is_ubi_based"] = True
@@ -346,6 +416,8 @@ class ContainerUBIValidator(BaseValidator):
 class ContainerVersionValidator(BaseValidator):
     """Validates that container images use the latest available version of the software."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "container_version"
@@ -367,60 +439,13 @@ class ContainerVersionValidator(BaseValidator):
 
     def _is_container_command(self, command_args: List[str]) -> bool:
         """Check if command is a container runtime command."""
-        if not command_args:
-            return False
-        
-        first_cmd = command_args[0]
-        if first_cmd in ["docker", "podman"]:
-            # Check if it's a run command with an image
-            if len(command_args) >= 3 and command_args[1] == "run":
-                return True
-        
-        return False
+        return _is_container_command(command_args)
 
     def _extract_image_name(self, command_args: List[str]) -> Optional[str]:
         """Extract container image name from command arguments."""
-        if not self._is_container_command(command_args):
-            return None
-        
-        # Find the image name in docker/podman run command
-        # Format: docker/podman run [options] IMAGE [command]
-        runtime = command_args[0]  # docker or podman
-        if len(command_args) < 3 or command_args[1] != "run":
+        if not command_args:
             return None
-        
-        # Options that take values
-        options_with_values = {
-            "-v", "--volume", "-e", "--env", "-p", "--port", "--name", 
-            "-w", "--workdir", "-u", "--user", "--entrypoint", "--hostname",
-            "--restart", "--memory", "--cpus", "--network", "--label"
-        }
-        
-        # Skip run and look for the image (skip options that start with -)
-        i = 2
-        while i < len(command_args):
-            arg = command_args[i]
-            
-            # Skip options and their values
-            if arg.startswith("-"):
-                # Check if this option takes a value
-                if arg in options_with_values:
-                    # Skip the option and its value
-                    i += 2
-                    continue
-                elif "=" in arg:
-                    # Option with value in same argument (like --env=VAR=value)
-                    i += 1
-                    continue
-                else:
-                    # Option without value (like --rm, -i, etc.)
-                    i += 1
-                    continue
-            else:
-                # First non-option argument should be the image
-                return arg
-            
-        return None
+        return _extract_image_name(tuple(command_args))
 
     async def validate(self, context: ValidationContext) -> ValidatorResult:
         """Execute container version validation."""
@@ -501,32 +526,8 @@ class ContainerVersionValidator(BaseValidator):
 
     def _parse_image_name(self, image_name: str) -> Dict[str, Any]:
         """Parse container image name to extract registry, repository, and tag."""
-        result = {
-            "image_registry": None,
-            "image_repository": None,
-            "image_tag": "latest",
-            "full_image_name": image_name,
-        }
-
-        # Split by tag separator
-        if ":" in image_name:
-            image_part, tag_part = image_name.rsplit(":", 1)
-            result["image_tag"] = tag_part
-        else:
-            image_part = image_name
-            result["image_tag"] = "latest"
-
-        # Split registry and repository
-        if "/" in image_part:
-            parts = image_part.split("/")
-            if "." in parts[0] or ":" in parts[0]:  # Likely a registry
-                result["image_registry"] = parts[0]
-                result["image_repository"] = "/".join(parts[1:])
-            else:
-                result["image_repository"] = image_part
-        else:
-            result["image_repository"] = image_part
-
+        # Copy so callers never mutate the cached parse
+        result = dict(_parse_image_name(image_name))
         debug_log(f"Parsed image: registry={result['image_registry']}, repo={result['image_repository']}, tag={result['image_tag']}")
         return result
 
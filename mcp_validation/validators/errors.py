@@ -11,6 +11,8 @@ from .base import BaseValidator, ValidationContext, ValidatorResult
 class ErrorComplianceValidator(BaseValidator):
     """Validates MCP error response compliance with JSON-RPC 2.0 standards."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "errors"
@@ -145,7 +147,7 @@ class ErrorComplianceValidator(BaseValidator):
 
             # Try to parse response
             try:
-                response = context.transport.parse_response(response_line.decode())
+                response = context.transport.parse_response(response_line)
 
                 if "error" in response:
                     error = response["error"]
@@ -10,6 +10,8 @@ from .base import BaseValidator, ValidationContext, ValidatorResult
 class PingValidator(BaseValidator):
     """Validates optional ping protocol functionality."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "ping"
@@ -10,6 +10,8 @@ from .base import BaseValidator, ValidationContext, ValidatorResult
 class ProtocolValidator(BaseValidator):
     """Validates basic MCP protocol compliance."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "protocol"
@@ -1,21 +1,49 @@
 """Package registry validator for MCP validation."""
 
 import asyncio
+import functools
+import hashlib
 import os
 import re
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
+from urllib.parse import quote, urlsplit
 
 import aiohttp
 
+try:
+    from packaging.utils import canonicalize_version
+except ImportError:  # packaging is optional; PyPI versions then match exactly
+    canonicalize_version = None
+
 from .base import BaseValidator, ValidationContext, ValidatorResult
+from .registry_fixtures import OFFLINE_PACKAGES
+from ..utils import fastjson
 from ..utils.debug import debug_log as _debug_log
+from ..utils.debug import is_debug_enabled
 
 
 def debug_log(message: str, level: str = "INFO") -> None:
-    """Registry-specific debug logging wrapper."""
-    _debug_log(message, level, "REGISTRY")
+    """Registry-specific debug logging wrapper.
+
+    Called several times per registry probe, so it checks the debug flag itself
+    and returns before delegating when debug output is off.
+    """
+    if is_debug_enabled():
+        _debug_log(message, level, "REGISTRY")
 
 
 @dataclass
@@ -27,68 +55,303 @@ class PackageInfo:
     registry_type: str = "npm"  # npm, pypi, docker
 
 
-def extract_packages_from_command(command_args: List[str]) -> List[PackageInfo]:
-    """Extract package information from MCP command arguments."""
-    packages = []
-
-    if not command_args:
-        debug_log("No command arguments provided", "INFO", "REGISTRY")
-        return packages
+# Command patterns, compiled once at import
+_PYTHON_PATTERNS = (
+    re.compile(r"python3?\s+-m\s+([^\s]+)"),  # python -m package
+    re.compile(r"python3?\s+([^\s]+\.py)"),  # python script.py
+)
+_DOCKER_PATTERN = re.compile(r"docker\s+run\s+(?:[^\s]+\s+)*([^\s:]+)(?::([^\s]+))?")
+
+
+def _split_npm_spec(spec: str) -> Tuple[str, Optional[str]]:
+    """Split ``name@version`` (or ``@scope/name@version``) into name and version."""
+    if spec.startswith("@"):
+        name, _, version = spec[1:].partition("@")
+        name = "@" + name
+    else:
+        name, _, version = spec.partition("@")
+    return name, version or None
+
+
+def _extract_npx_specs(command_args: List[str]) -> List[Tuple[str, Optional[str]]]:
+    """Find ``npx [flags] package[@version]`` specs in one linear pass over argv.
+
+    Works on the already tokenized arguments, so there is no regex backtracking.
+    """
+    specs = []
+    args = iter(command_args)
+    for arg in args:
+        if os.path.basename(arg) != "npx":
+            continue
+        # The first non-flag argument after npx is the package spec
+        for spec in args:
+            if not spec.startswith("-"):
+                specs.append(_split_npm_spec(spec))
+                break
+    return specs
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_command_specs(
+    command_args: Tuple[str, ...]
+) -> Tuple[Tuple[str, Optional[str], str], ...]:
+    """Extract (name, version, registry type) specs from a command, cached per command."""
+    specs = [(name, version, "npm") for name, version in _extract_npx_specs(command_args)]
 
     # Join command args to get full command
     full_command = " ".join(command_args)
-    debug_log(f"Extracting packages from command: {full_command}")
-
-    # Pattern 1: npx package@version (including scoped packages)
-    npx_pattern = r"npx\s+(?:-[gy]\s+|--[^\s]+\s+)*(@?[^@\s]+)(?:@([^\s]+))?"
-    npx_matches = re.findall(npx_pattern, full_command)
-
-    for package_name, version in npx_matches:
-        # Clean up package name (remove empty strings from regex groups)
-        package_name = package_name.strip()
-        version = version.strip() if version else None
-
-        if package_name and not package_name.startswith("-"):
-            package_info = PackageInfo(name=package_name, version=version, registry_type="npm")
-            packages.append(package_info)
-            debug_log(f"Extracted npm package: {package_name}" + (f"@{version}" if version else ""))
-
-    # Pattern 2: python -m package or python package.py
-    python_patterns = [
-        r"python3?\s+-m\s+([^\s]+)",  # python -m package
-        r"python3?\s+([^\s]+\.py)",  # python script.py
-    ]
 
-    for pattern in python_patterns:
-        python_matches = re.findall(pattern, full_command)
-        for match in python_matches:
+    # python -m package or python package.py
+    for pattern in _PYTHON_PATTERNS:
+        for match in pattern.findall(full_command):
             if match and not match.startswith("-"):
                 # Extract potential package name (convert to PyPI naming)
-                package_name = match.replace(".py", "").replace("_", "-")
-                package_info = PackageInfo(name=package_name, registry_type="pypi")
-                packages.append(package_info)
-                debug_log(f"Extracted python package: {package_name}")
+                specs.append((match.replace(".py", "").replace("_", "-"), None, "pypi"))
 
-    # Pattern 3: docker run image:tag
-    docker_pattern = r"docker\s+run\s+(?:[^\s]+\s+)*([^\s:]+)(?::([^\s]+))?"
-    docker_matches = re.findall(docker_pattern, full_command)
-
-    for image_name, tag in docker_matches:
+    # docker run image:tag
+    for image_name, tag in _DOCKER_PATTERN.findall(full_command):
         image_name = image_name.strip()
-        tag = tag.strip() if tag else None
-
         if image_name and not image_name.startswith("-"):
-            package_info = PackageInfo(name=image_name, version=tag, registry_type="docker")
-            packages.append(package_info)
-            debug_log(f"Extracted docker image: {image_name}" + (f":{tag}" if tag else ""))
+            specs.append((image_name, tag.strip() or None, "docker"))
+
+    return tuple(specs)
+
+
+def extract_packages_from_command(command_args: List[str]) -> List[PackageInfo]:
+    """Extract package information from MCP command arguments."""
+    packages = []
+
+    if not command_args:
+        debug_log("No command arguments provided")
+        return packages
+
+    debug_log(f"Extracting packages from command: {' '.join(command_args)}")
+
+    # Validators re-run for every scenario against the same command, so the
+    # parse is cached and only the PackageInfo objects are rebuilt
+    for name, version, registry_type in _extract_command_specs(tuple(command_args)):
+        packages.append(PackageInfo(name=name, version=version, registry_type=registry_type))
+        separator = ":" if registry_type == "docker" else "@"
+        debug_log(
+            f"Extracted {registry_type} package: {name}"
+            + (f"{separator}{version}" if version else "")
+        )
 
     debug_log(f"Total packages extracted from command: {len(packages)}")
     return packages
 
 
+# [docker:|pypi:]name[@version]; a leading "@" belongs to an npm scope
+_PACKAGE_SPEC_PATTERN = re.compile(
+    r"(?:(?P<type>docker|pypi):)?(?P<name>@?[^@]*)(?:@(?P<version>.*))?"
+)
+
+
+def _infer_registry_type(name: str) -> str:
+    """Infer the registry for a spec without an explicit ``docker:``/``pypi:`` prefix."""
+    if name.endswith(".py"):
+        # Unprefixed names are only classified as PyPI when they end with .py
+        return "pypi"
+    if "/" in name and not name.startswith("@"):
+        # Docker images often have '/' but npm scoped packages start with '@'
+        return "docker"
+    # Default to npm for ambiguous names (most common case)
+    return "npm"
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_package_spec(spec: str) -> Tuple[str, Optional[str], str]:
+    """Parse a ``[docker:|pypi:]name[@version]`` string into (name, version, registry type)."""
+    match = _PACKAGE_SPEC_PATTERN.fullmatch(spec)
+    name, version, registry_type = match["name"], match["version"] or None, match["type"]
+
+    if registry_type is None:
+        registry_type = _infer_registry_type(name)
+    return name, version, registry_type
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_pypi_version(version: str) -> str:
+    """PEP 440 canonical form, so "2.31", "2.31.0" and "2.31.0.0" compare equal."""
+    if canonicalize_version is None:
+        return version
+    return canonicalize_version(version)
+
+
+def _pypi_version_set(releases: Dict[str, Any]) -> FrozenSet[str]:
+    """Release names plus their canonical forms, parsed once per document."""
+    return frozenset(releases).union(map(_canonical_pypi_version, releases))
+
+
+def _apply_requested_version(
+    result: Dict[str, Any], versions: FrozenSet[str], package: PackageInfo, label: str
+) -> Dict[str, Any]:
+    """Record whether the requested version is among a found package's versions."""
+    if package.version and result.get("exists"):
+        version_exists = package.version in versions
+        if not version_exists and package.registry_type == "pypi":
+            version_exists = _canonical_pypi_version(package.version) in versions
+        debug_log(f"{label}: Version '{package.version}' exists: {version_exists}")
+        result["requested_version_exists"] = version_exists
+    return result
+
+
+class _RateLimiter:
+    """Token bucket allowing ``rate`` requests per second with bursts of ``burst``.
+
+    Implemented as a generic cell rate algorithm: each acquire reserves the next
+    slot synchronously, so no lock (and no event loop binding) is needed.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.interval = 1.0 / rate
+        self.tolerance = (burst - 1) * self.interval
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        now = time.monotonic()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self.interval
+        delay = slot - self.tolerance - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Requests per second for the public registries; other hosts are not throttled
+_HOST_RATE_LIMITS = {
+    "registry.npmjs.org": 20.0,
+    "pypi.org": 20.0,
+    "hub.docker.com": 10.0,
+}
+_host_limiters: Dict[str, _RateLimiter] = {}
+
+
+async def _throttle(url: str) -> None:
+    """Pace requests to rate-limited registry hosts so concurrent checks avoid 429s."""
+    host = urlsplit(url).hostname
+    rate = _HOST_RATE_LIMITS.get(host)
+    if rate is None:
+        return
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        limiter = _host_limiters[host] = _RateLimiter(rate, burst=int(rate))
+    await limiter.acquire()
+
+
+def _http_cache_dir() -> Optional[Path]:
+    """Directory for registry documents kept for conditional requests, or None if disabled.
+
+    MCP_VALIDATION_CACHE_DIR overrides the XDG cache location; set it empty to disable.
+    """
+    root = os.environ.get("MCP_VALIDATION_CACHE_DIR")
+    if root is None:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        root = os.path.join(xdg_cache, "mcp_validation")
+    elif not root:
+        return None
+    return Path(root) / "registry"
+
+
+def _store_document(body_path: Path, meta_path: Path, body: bytes, validators: Dict) -> None:
+    """Save a fetched document and its validators; the cache is best effort."""
+    try:
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = body_path.with_suffix(".tmp")
+        tmp_path.write_bytes(body)
+        os.replace(tmp_path, body_path)
+        meta_path.write_bytes(fastjson.dumps(validators))
+    except OSError as e:
+        debug_log(f"Could not cache registry document {body_path}: {e}", "WARN")
+
+
+async def _conditional_get(
+    session: aiohttp.ClientSession, url: str, accept: Optional[str] = None
+) -> Tuple[int, bytes]:
+    """GET ``url``, revalidating a copy kept on disk from an earlier run.
+
+    Documents are stored with their ETag/Last-Modified headers; a 304 answer
+    returns the stored body as a 200 so callers see no difference. ``accept``
+    selects a representation and is part of the stored copy's identity.
+    """
+    cache_dir = _http_cache_dir()
+    headers = {}
+    if cache_dir is not None:
+        identity = url if accept is None else f"{url}\n{accept}"
+        stem = hashlib.sha256(identity.encode()).hexdigest()
+        body_path = cache_dir / f"{stem}.json"
+        meta_path = cache_dir / f"{stem}.meta"
+        try:
+            validators = fastjson.loads(meta_path.read_bytes()) if body_path.is_file() else {}
+        except (OSError, ValueError):
+            validators = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    conditional = bool(headers)
+    if accept is not None:
+        headers["Accept"] = accept
+
+    await _throttle(url)
+    async with session.get(
+        url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)
+    ) as response:
+        if response.status == 304 and conditional:
+            debug_log(f"Registry document unchanged, using cached copy of {url}")
+            try:
+                return 200, body_path.read_bytes()
+            except OSError:
+                return response.status, b""
+        body = await response.read()
+        if response.status == 200 and cache_dir is not None:
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            if any(validators.values()):
+                _store_document(body_path, meta_path, body, validators)
+        return response.status, body
+
+
+async def _check_exists(
+    session: aiohttp.ClientSession,
+    url: str,
+    name: str,
+    registry_url: str,
+    not_found_error: str,
+    label: str,
+) -> Dict[str, Any]:
+    """Answer existence alone with a HEAD request, without downloading the document."""
+    debug_log(f"{label}: Checking existence of '{name}' with HEAD {url}")
+    result = {"exists": False, "name": name, "registry_url": registry_url}
+    try:
+        await _throttle(url)
+        async with session.head(
+            url, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            debug_log(f"{label}: Response status: {response.status}")
+            if response.status == 200:
+                result["exists"] = True
+            elif response.status == 404:
+                result["error"] = not_found_error
+            else:
+                result["error"] = f"Registry error: HTTP {response.status}"
+    except asyncio.TimeoutError:
+        debug_log(f"{label}: Request timeout for '{name}'", "ERROR")
+        result["error"] = "Registry request timeout"
+    except Exception as e:
+        debug_log(f"{label}: Request failed for '{name}': {str(e)}", "ERROR")
+        result["error"] = f"Registry request failed: {str(e)}"
+    return result
+
+
 class RegistryChecker(Protocol):
     """Protocol for registry checker implementations."""
 
+    registry_url: str
+
     async def check_package(
         self, package: PackageInfo, session: aiohttp.ClientSession
     ) -> Dict[str, Any]:
@@ -96,77 +359,91 @@ class RegistryChecker(Protocol):
         ...
 
 
+# Abbreviated packument: versions and dist-tags only, without READMEs or descriptions
+_NPM_ABBREVIATED = "application/vnd.npm.install-v1+json"
+
+
 class NPMRegistryChecker:
     """NPM registry checker implementation."""
 
-    def __init__(self, registry_url: str = "https://registry.npmjs.org"):
+    def __init__(self, registry_url: str = "https://registry.npmjs.org", abbreviated: bool = False):
         self.registry_url = registry_url.rstrip("/")
+        # Fetch the much smaller install metadata; results then have no description
+        self.abbreviated = abbreviated
 
     async def check_package(
         self, package: PackageInfo, session: aiohttp.ClientSession
     ) -> Dict[str, Any]:
         """Check if NPM package exists."""
-        url = f"{self.registry_url}/{package.name}"
-        debug_log(f"NPM: Checking package '{package.name}' at {url}")
+        result, versions = await self.fetch_package(package.name, session)
+        return _apply_requested_version(result, versions, package, "NPM")
+
+    async def package_exists(self, name: str, session: aiohttp.ClientSession) -> Dict[str, Any]:
+        """Check only that the package exists, skipping the (often large) packument."""
+        url = f"{self.registry_url}/{name}"
+        return await _check_exists(
+            session, url, name, self.registry_url, "Package not found", "NPM"
+        )
+
+    async def fetch_package(
+        self, name: str, session: aiohttp.ClientSession
+    ) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+        """Fetch the package document once; it answers existence and every version."""
+        url = f"{self.registry_url}/{name}"
+        debug_log(f"NPM: Checking package '{name}' at {url}")
 
         try:
             debug_log(f"NPM: Making HTTP request to {url}")
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                debug_log(f"NPM: Response status: {response.status}")
-                if response.status == 200:
-                    data = await response.json()
-                    versions = list(data.get("versions", {}).keys())
-                    debug_log(
-                        f"NPM: Package '{package.name}' exists, found {len(versions)} versions"
-                    )
-
-                    result = {
-                        "exists": True,
-                        "name": package.name,
-                        "registry_url": self.registry_url,
-                        "available_versions": versions[:10],  # Limit to first 10 versions
-                        "latest_version": data.get("dist-tags", {}).get("latest"),
-                        "description": data.get("description", ""),
-                    }
-
-                    if package.version:
-                        version_exists = package.version in data.get("versions", {})
-                        debug_log(f"NPM: Version '{package.version}' exists: {version_exists}")
-                        result["requested_version_exists"] = version_exists
-
-                    return result
-                elif response.status == 404:
-                    debug_log(f"NPM: Package '{package.name}' not found (404)")
-                    return {
-                        "exists": False,
-                        "name": package.name,
-                        "registry_url": self.registry_url,
-                        "error": "Package not found",
-                    }
-                else:
-                    debug_log(f"NPM: Registry error: HTTP {response.status}", "WARN")
-                    return {
-                        "exists": False,
-                        "name": package.name,
-                        "registry_url": self.registry_url,
-                        "error": f"Registry error: HTTP {response.status}",
-                    }
+            accept = _NPM_ABBREVIATED if self.abbreviated else None
+            status, body = await _conditional_get(session, url, accept)
+            debug_log(f"NPM: Response status: {status}")
+            if status == 200:
+                data = fastjson.loads(body)
+                versions = data.get("versions", {})
+                debug_log(f"NPM: Package '{name}' exists, found {len(versions)} versions")
+
+                result = {
+                    "exists": True,
+                    "name": name,
+                    "registry_url": self.registry_url,
+                    "available_versions": list(versions)[:10],  # Limit to first 10 versions
+                    "latest_version": data.get("dist-tags", {}).get("latest"),
+                    "description": data.get("description", ""),
+                }
+
+                return result, frozenset(versions)
+            elif status == 404:
+                debug_log(f"NPM: Package '{name}' not found (404)")
+                return {
+                    "exists": False,
+                    "name": name,
+                    "registry_url": self.registry_url,
+                    "error": "Package not found",
+                }, frozenset()
+            else:
+                debug_log(f"NPM: Registry error: HTTP {status}", "WARN")
+                return {
+                    "exists": False,
+                    "name": name,
+                    "registry_url": self.registry_url,
+                    "error": f"Registry error: HTTP {status}",
+                }, frozenset()
         except asyncio.TimeoutError:
-            debug_log(f"NPM: Request timeout for package '{package.name}'", "ERROR")
+            debug_log(f"NPM: Request timeout for package '{name}'", "ERROR")
             return {
                 "exists": False,
-                "name": package.name,
+                "name": name,
                 "registry_url": self.registry_url,
                 "error": "Registry request timeout",
-            }
+            }, frozenset()
         except Exception as e:
-            debug_log(f"NPM: Request failed for package '{package.name}': {str(e)}", "ERROR")
+            debug_log(f"NPM: Request failed for package '{name}': {str(e)}", "ERROR")
             return {
                 "exists": False,
-                "name": package.name,
+                "name": name,
                 "registry_url": self.registry_url,
                 "error": f"Registry request failed: {str(e)}",
-            }
+            }, frozenset()
 
 
 class PyPIRegistryChecker:
@@ -179,67 +456,67 @@ class PyPIRegistryChecker:
         self, package: PackageInfo, session: aiohttp.ClientSession
     ) -> Dict[str, Any]:
         """Check if PyPI package exists."""
-        url = f"{self.registry_url}/pypi/{package.name}/json"
-        debug_log(f"PyPI: Checking package '{package.name}' at {url}")
+        result, versions = await self.fetch_package(package.name, session)
+        return _apply_requested_version(result, versions, package, "PyPI")
+
+    async def fetch_package(
+        self, name: str, session: aiohttp.ClientSession
+    ) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+        """Fetch the project JSON once; its releases answer every version check."""
+        url = f"{self.registry_url}/pypi/{name}/json"
+        debug_log(f"PyPI: Checking package '{name}' at {url}")
 
         try:
             debug_log(f"PyPI: Making HTTP request to {url}")
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                debug_log(f"PyPI: Response status: {response.status}")
-                if response.status == 200:
-                    data = await response.json()
-                    versions = list(data.get("releases", {}).keys())
-                    debug_log(
-                        f"PyPI: Package '{package.name}' exists, found {len(versions)} versions"
-                    )
-
-                    result = {
-                        "exists": True,
-                        "name": package.name,
-                        "registry_url": self.registry_url,
-                        "available_versions": versions[-10:],  # Last 10 versions
-                        "latest_version": data.get("info", {}).get("version"),
-                        "description": data.get("info", {}).get("summary", ""),
-                    }
-
-                    if package.version:
-                        version_exists = package.version in data.get("releases", {})
-                        debug_log(f"PyPI: Version '{package.version}' exists: {version_exists}")
-                        result["requested_version_exists"] = version_exists
-
-                    return result
-                elif response.status == 404:
-                    debug_log(f"PyPI: Package '{package.name}' not found (404)")
-                    return {
-                        "exists": False,
-                        "name": package.name,
-                        "registry_url": self.registry_url,
-                        "error": "Package not found",
-                    }
-                else:
-                    debug_log(f"PyPI: Registry error: HTTP {response.status}", "WARN")
-                    return {
-                        "exists": False,
-                        "name": package.name,
-                        "registry_url": self.registry_url,
-                        "error": f"Registry error: HTTP {response.status}",
-                    }
+            status, body = await _conditional_get(session, url)
+            debug_log(f"PyPI: Response status: {status}")
+            if status == 200:
+                data = fastjson.loads(body)
+                versions = data.get("releases", {})
+                debug_log(f"PyPI: Package '{name}' exists, found {len(versions)} versions")
+
+                result = {
+                    "exists": True,
+                    "name": name,
+                    "registry_url": self.registry_url,
+                    "available_versions": list(versions)[-10:],  # Last 10 versions
+                    "latest_version": data.get("info", {}).get("version"),
+                    "description": data.get("info", {}).get("summary", ""),
+                }
+
+                return result, _pypi_version_set(versions)
+            elif status == 404:
+                debug_log(f"PyPI: Package '{name}' not found (404)")
+                return {
+                    "exists": False,
+                    "name": name,
+                    "registry_url": self.registry_url,
+                    "error": "Package not found",
+                }, frozenset()
+            else:
+                debug_log(f"PyPI: Registry error: HTTP {status}", "WARN")
+                return {
+                    "exists": False,
+                    "name": name,
+                    "registry_url": self.registry_url,
+                    "error": f"Registry error: HTTP {status}",
+                }, frozenset()
         except asyncio.TimeoutError:
-            debug_log(f"PyPI: Request timeout for package '{package.name}'", "ERROR")
+            debug_log(f"PyPI: Request timeout for package '{name}'", "ERROR")
             return {
                 "exists": False,
-                "name": package.name,
+                "name": name,
                 "registry_url": self.registry_url,
                 "error": "Registry request timeout",
-            }
+            }, frozenset()
         except Exception as e:
-            debug_log(f"PyPI: Request failed for package '{package.name}': {str(e)}", "ERROR")
+            debug_log(f"PyPI: Request failed for package '{name}': {str(e)}", "ERROR")
             return {
                 "exists": False,
-                "name": package.name,
+                "name": name,
                 "registry_url": self.registry_url,
                 "error": f"Registry request failed: {str(e)}",
-            }
+            }, frozenset()
 
 
 class DockerRegistryChecker:
@@ -249,73 +526,91 @@ class DockerRegistryChecker:
         self.registry_url = registry_url.rstrip("/")
         self.hub_url = "https://hub.docker.com"
 
+    @staticmethod
+    async def _get_json(session: aiohttp.ClientSession, url: str) -> Tuple[int, Any]:
+        """GET ``url``, returning the status and, for a 200, the decoded body."""
+        await _throttle(url)
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status != 200:
+                return response.status, None
+            return response.status, fastjson.loads(await response.read())
+
+    def _repository_url(self, name: str) -> str:
+        """Docker Hub API URL for an image repository."""
+        # For Docker Hub, use the Hub API which is more accessible
+        # Format: namespace/repository or just repository for official images
+        if "/" not in name:
+            # Official image
+            return f"{self.hub_url}/v2/repositories/library/{name}"
+        # User/org image
+        return f"{self.hub_url}/v2/repositories/{name}"
+
+    async def package_exists(self, name: str, session: aiohttp.ClientSession) -> Dict[str, Any]:
+        """Check only that the image repository exists, without listing its tags."""
+        return await _check_exists(
+            session, self._repository_url(name), name, self.hub_url, "Image not found", "Docker"
+        )
+
     async def check_package(
         self, package: PackageInfo, session: aiohttp.ClientSession
     ) -> Dict[str, Any]:
         """Check if Docker image exists."""
-        # For Docker Hub, use the Hub API which is more accessible
-        # Format: namespace/repository or just repository for official images
-        if "/" not in package.name:
-            # Official image
-            url = f"{self.hub_url}/v2/repositories/library/{package.name}"
-            debug_log(f"Docker: Checking official image '{package.name}' at {url}")
-        else:
-            # User/org image
-            url = f"{self.hub_url}/v2/repositories/{package.name}"
-            debug_log(f"Docker: Checking user/org image '{package.name}' at {url}")
+        url = self._repository_url(package.name)
+        debug_log(f"Docker: Checking image '{package.name}' at {url}")
 
         try:
-            debug_log(f"Docker: Making HTTP request to {url}")
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                debug_log(f"Docker: Response status: {response.status}")
-                if response.status == 200:
-                    data = await response.json()
-                    debug_log(f"Docker: Image '{package.name}' exists")
-
-                    # Get tags
-                    tags_url = f"{url}/tags"
-                    debug_log(f"Docker: Getting tags from {tags_url}")
-                    async with session.get(
-                        tags_url, timeout=aiohttp.ClientTimeout(total=10)
-                    ) as tags_response:
-                        tags_data = (
-                            await tags_response.json() if tags_response.status == 200 else {}
-                        )
-                        tags = [tag["name"] for tag in tags_data.get("results", [])[:10]]
-                        debug_log(f"Docker: Found {len(tags)} tags for '{package.name}'")
-
-                    result = {
-                        "exists": True,
-                        "name": package.name,
-                        "registry_url": self.hub_url,
-                        "available_tags": tags,
-                        "description": data.get("description", ""),
-                        "is_official": data.get("is_official", False),
-                        "pull_count": data.get("pull_count", 0),
-                    }
-
-                    if package.version:
-                        tag_exists = package.version in tags
-                        debug_log(f"Docker: Tag '{package.version}' exists: {tag_exists}")
-                        result["requested_tag_exists"] = tag_exists
-
-                    return result
-                elif response.status == 404:
-                    debug_log(f"Docker: Image '{package.name}' not found (404)")
-                    return {
-                        "exists": False,
-                        "name": package.name,
-                        "registry_url": self.hub_url,
-                        "error": "Image not found",
-                    }
+            # A requested tag is looked up directly rather than searched for in
+            # the first page of the tag listing, which only lists the newest tags
+            if package.version:
+                tags_url = f"{url}/tags/{quote(package.version, safe='')}"
+            else:
+                tags_url = f"{url}/tags"
+
+            # The tags request does not depend on the repository response, so
+            # both are sent at once instead of one round trip after the other
+            debug_log(f"Docker: Making HTTP requests to {url} and {tags_url}")
+            (status, data), (tags_status, tags_data) = await asyncio.gather(
+                self._get_json(session, url), self._get_json(session, tags_url)
+            )
+            debug_log(f"Docker: Response status: {status}")
+            if status == 200:
+                debug_log(f"Docker: Image '{package.name}' exists")
+
+                result = {
+                    "exists": True,
+                    "name": package.name,
+                    "registry_url": self.hub_url,
+                    "description": data.get("description", ""),
+                    "is_official": data.get("is_official", False),
+                    "pull_count": data.get("pull_count", 0),
+                }
+
+                if package.version:
+                    tag_exists = tags_status == 200
+                    debug_log(f"Docker: Tag '{package.version}' exists: {tag_exists}")
+                    result["requested_tag_exists"] = tag_exists
                 else:
-                    debug_log(f"Docker: Registry error: HTTP {response.status}", "WARN")
-                    return {
-                        "exists": False,
-                        "name": package.name,
-                        "registry_url": self.hub_url,
-                        "error": f"Registry error: HTTP {response.status}",
-                    }
+                    tags = [tag["name"] for tag in (tags_data or {}).get("results", [])[:10]]
+                    debug_log(f"Docker: Found {len(tags)} tags for '{package.name}'")
+                    result["available_tags"] = tags
+
+                return result
+            elif status == 404:
+                debug_log(f"Docker: Image '{package.name}' not found (404)")
+                return {
+                    "exists": False,
+                    "name": package.name,
+                    "registry_url": self.hub_url,
+                    "error": "Image not found",
+                }
+            else:
+                debug_log(f"Docker: Registry error: HTTP {status}", "WARN")
+                return {
+                    "exists": False,
+                    "name": package.name,
+                    "registry_url": self.hub_url,
+                    "error": f"Registry error: HTTP {status}",
+                }
         except asyncio.TimeoutError:
             debug_log(f"Docker: Request timeout for image '{package.name}'", "ERROR")
             return {
@@ -334,20 +629,197 @@ class DockerRegistryChecker:
             }
 
 
+# Process-wide HTTP session so registry connections (and TLS handshakes) are
+# reused across validators. aiohttp sessions are bound to the event loop that
+# created them, so a new one is opened when the loop changes.
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    """Return the keep-alive registry session for the running loop, opening it if needed."""
+    global _shared_session, _shared_session_loop
+    loop = asyncio.get_running_loop()
+    if _shared_session is None or _shared_session.closed or _shared_session_loop is not loop:
+        debug_log("Creating shared HTTP session for registry requests")
+        connector = aiohttp.TCPConnector(
+            limit=32, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=60
+        )
+        _shared_session = aiohttp.ClientSession(connector=connector)
+        _shared_session_loop = loop
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared registry session; call before the event loop shuts down."""
+    global _shared_session, _shared_session_loop
+    session, _shared_session, _shared_session_loop = _shared_session, None, None
+    if session is not None and not session.closed:
+        await session.close()
+
+
+# Check results keyed by (request, registry type, registry URL, name, version).
+# The request is "GET", "GET abbreviated" or "HEAD"; the latter two answer less
+# than a full document. The version is None for registries whose package
+# document lists every version.
+_CheckKey = Tuple[str, str, str, str, Optional[str]]
+# A check result plus the versions it lists (empty when not applicable)
+_Lookup = Tuple[Dict[str, Any], FrozenSet[str]]
+
+
+def _fetch_cache_key(key: _CheckKey) -> str:
+    """Key for a lookup in ``ValidationContext.fetch_cache``.
+
+    Full package documents use "<registry type>:<name>" so other validators can
+    find them; partial answers and per-tag lookups are qualified further.
+    """
+    request, registry_type, _, name, version = key
+    run_key = f"{registry_type}:{name}"
+    if version is not None:
+        run_key += f"@{version}"
+    if request != "GET":
+        run_key += f" ({request})"
+    return run_key
+
+
+# Missing-package errors are definitive answers and are cached like hits
+_DEFINITIVE_ERRORS = frozenset(("Package not found", "Image not found"))
+
+
+def _is_missing(result: Dict[str, Any]) -> bool:
+    """Whether a check result means the package does not exist (not a transient error)."""
+    if result.get("exists", False):
+        return False
+    error = result.get("error")
+    return not error or "not found" in error.lower() or "404" in error
+
+
+async def _gather_until_missing(checks: List[Awaitable[Dict[str, Any]]]) -> List[Any]:
+    """Like ``gather(..., return_exceptions=True)``, but stop at the first missing package.
+
+    Checks still running at that point are cancelled and reported as None.
+    """
+    tasks = [asyncio.ensure_future(check) for check in checks]
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        if any(
+            not task.cancelled() and task.exception() is None and _is_missing(task.result())
+            for task in done
+        ):
+            break
+
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    return [
+        None if task.cancelled() else (task.exception() or task.result()) for task in tasks
+    ]
+
+
+def _failed_check(
+    package: PackageInfo, checker: RegistryChecker, exc: BaseException
+) -> Dict[str, Any]:
+    """Build the check result for a lookup that raised instead of returning."""
+    if isinstance(exc, asyncio.TimeoutError):
+        error = "Registry request timeout"
+    else:
+        error = f"Registry request failed: {str(exc)}"
+    debug_log(f"Check for {package.name} did not complete: {error}", "ERROR")
+    return {
+        "exists": False,
+        "name": package.name,
+        "registry_url": checker.registry_url,
+        "error": error,
+    }
+
+
+def _offline_mode() -> bool:
+    """Whether MCP_VALIDATION_TEST_OFFLINE asks for canned registry answers."""
+    return os.environ.get("MCP_VALIDATION_TEST_OFFLINE", "") not in ("", "0")
+
+
+def _offline_check(checker: RegistryChecker, package: PackageInfo) -> Dict[str, Any]:
+    """Answer a check from ``OFFLINE_PACKAGES`` in the shape the live checker returns."""
+    registry_url = getattr(checker, "hub_url", checker.registry_url)
+    entry = OFFLINE_PACKAGES.get((package.registry_type, package.name))
+    debug_log(f"Offline: Checking {package.registry_type} package '{package.name}'")
+    if entry is None:
+        missing = "Image not found" if package.registry_type == "docker" else "Package not found"
+        return {
+            "exists": False,
+            "name": package.name,
+            "registry_url": registry_url,
+            "error": missing,
+        }
+
+    result = {
+        "exists": True,
+        "name": package.name,
+        "registry_url": registry_url,
+        "description": entry.get("description", ""),
+    }
+    if "tags" in entry:
+        result["is_official"] = entry.get("is_official", False)
+        result["pull_count"] = 0
+        if package.version:
+            result["requested_tag_exists"] = package.version in entry["tags"]
+        else:
+            result["available_tags"] = list(entry["tags"][:10])
+        return result
+
+    result["available_versions"] = list(entry["versions"][:10])
+    result["latest_version"] = entry["latest"]
+    if package.registry_type == "pypi":
+        versions = _pypi_version_set(dict.fromkeys(entry["versions"]))
+    else:
+        versions = frozenset(entry["versions"])
+    return _apply_requested_version(result, versions, package, "Offline")
+
+
 class RegistryValidator(BaseValidator):
     """Validator for checking package existence in registries."""
 
-    def __init__(self, config: Dict[str, Any] = None):
+    __slots__ = ("session", "max_concurrency", "existence_only", "checkers", "packages")
+
+    # Definitive lookups shared by all validators as (expires_at, lookup), least
+    # recently used first. Timeouts and other transient registry errors are never cached.
+    _check_cache: "OrderedDict[_CheckKey, Tuple[float, _Lookup]]" = OrderedDict()
+    _check_cache_ttl = 600.0
+    _check_cache_maxsize = 512
+    # Lookups in progress, so concurrent duplicates share one request, and how
+    # many callers are waiting on each
+    _in_flight: Dict[_CheckKey, "asyncio.Future[_Lookup]"] = {}
+    _waiters: Dict["asyncio.Future[_Lookup]", int] = {}
+
+    def __init__(
+        self,
+        config: Dict[str, Any] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         super().__init__(config)
         debug_log(f"Initializing RegistryValidator with config: {config}")
 
+        # Optional caller-owned HTTP session; the shared registry session is used otherwise
+        self.session = session
+
+        # Upper bound on registry requests in flight at once for one validate()
+        self.max_concurrency = self.config.get("max_concurrency", 8)
+
+        # Answer unversioned packages with HEAD requests where the registry supports
+        # it (results then omit descriptions, versions and tags) and versioned npm
+        # packages from the abbreviated packument (no description)
+        self.existence_only = self.config.get("existence_only", False)
+
         # Initialize registry checkers with custom URLs if provided
         registry_configs = self.config.get("registries", {})
         debug_log(f"Registry configurations: {registry_configs}")
 
         self.checkers = {
             "npm": NPMRegistryChecker(
-                registry_configs.get("npm_url", "https://registry.npmjs.org")
+                registry_configs.get("npm_url", "https://registry.npmjs.org"),
+                abbreviated=self.existence_only,
             ),
             "pypi": PyPIRegistryChecker(registry_configs.get("pypi_url", "https://pypi.org")),
             "docker": DockerRegistryChecker(
@@ -368,27 +840,7 @@ class RegistryValidator(BaseValidator):
         for pkg_config in packages_config:
             debug_log(f"Processing package config: {pkg_config}")
             if isinstance(pkg_config, str):
-                # Simple string format: "package_name" or "package_name@version"
-                if "@" in pkg_config and not pkg_config.startswith("@"):
-                    name, version = pkg_config.split("@", 1)
-                else:
-                    name, version = pkg_config, None
-
-                # Infer registry type from name patterns
-                if name.startswith("docker:"):
-                    registry_type = "docker"
-                    name = name.replace("docker:", "")
-                elif name.startswith("pypi:") or name.endswith(".py"):
-                    # Only classify as PyPI if explicitly prefixed or ends with .py
-                    registry_type = "pypi"
-                    name = name.replace("pypi:", "")
-                elif "/" in name and not name.startswith("@"):
-                    # Docker images often have '/' but npm scoped packages start with '@'
-                    registry_type = "docker"
-                else:
-                    # Default to npm for ambiguous names (most common case)
-                    registry_type = "npm"
-
+                name, version, registry_type = _parse_package_spec(pkg_config)
                 debug_log(
                     f"Parsed string package: {name} (type: {registry_type}, version: {version})"
                 )
@@ -411,6 +863,144 @@ class RegistryValidator(BaseValidator):
         debug_log(f"Total packages parsed: {len(packages)}")
         return packages
 
+    @classmethod
+    def clear_check_cache(cls) -> None:
+        """Forget cached registry lookups."""
+        cls._check_cache.clear()
+
+    async def _cached_check(
+        self,
+        checker: RegistryChecker,
+        package: PackageInfo,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        fetch_cache: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Check a package, reusing a recent answer or a lookup already in flight.
+
+        Checkers with ``fetch_package`` (npm, PyPI) are looked up once per name
+        and every requested version is answered from that one document; the
+        rest (Docker tags) are looked up per version. With ``existence_only``,
+        unversioned packages are answered by ``package_exists`` where available.
+        With MCP_VALIDATION_TEST_OFFLINE set, no request is made at all.
+        """
+        if _offline_mode():
+            return _offline_check(checker, package)
+
+        package_exists = getattr(checker, "package_exists", None)
+        if self.existence_only and package.version is None and package_exists is not None:
+            key = ("HEAD", package.registry_type, checker.registry_url, package.name, None)
+
+            async def _exists() -> _Lookup:
+                return await package_exists(package.name, session), frozenset()
+
+            result, _ = await self._cached_lookup(key, _exists, semaphore, fetch_cache)
+            return result
+
+        fetch_package = getattr(checker, "fetch_package", None)
+        if fetch_package is None:
+            key = (
+                "GET",
+                package.registry_type,
+                checker.registry_url,
+                package.name,
+                package.version,
+            )
+
+            async def _lookup() -> _Lookup:
+                return await checker.check_package(package, session), frozenset()
+
+        else:
+            request = "GET abbreviated" if getattr(checker, "abbreviated", False) else "GET"
+            key = (request, package.registry_type, checker.registry_url, package.name, None)
+
+            async def _lookup() -> _Lookup:
+                return await fetch_package(package.name, session)
+
+        result, versions = await self._cached_lookup(key, _lookup, semaphore, fetch_cache)
+        if fetch_package is None:
+            return result
+        return _apply_requested_version(result, versions, package, package.registry_type)
+
+    async def _cached_lookup(
+        self,
+        key: _CheckKey,
+        lookup: Callable[[], Awaitable[_Lookup]],
+        semaphore: asyncio.Semaphore,
+        fetch_cache: Dict[str, Any],
+    ) -> _Lookup:
+        """Run ``lookup`` unless ``key`` is cached or already in flight.
+
+        Definitive answers are also kept in the run's ``fetch_cache``, which
+        other validators share and which outlives the TTL of the class cache.
+        Returns a copy of the result dict so callers may annotate it.
+        """
+        run_key = _fetch_cache_key(key)
+        cached_run = fetch_cache.get(run_key)
+        if cached_run is not None:
+            debug_log(f"Using registry result fetched earlier in this run for {key[3]}")
+            result, versions = cached_run
+            return dict(result), versions
+
+        cached = self._check_cache.get(key)
+        if cached is not None:
+            expires_at, (result, versions) = cached
+            if expires_at > time.monotonic():
+                debug_log(f"Using cached registry result for {key[3]}")
+                self._check_cache.move_to_end(key)
+                return dict(result), versions
+            del self._check_cache[key]
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            debug_log(f"Waiting for in-flight registry lookup of {key[3]}")
+            result, versions = await self._wait_shared(pending)
+            return dict(result), versions
+
+        async def _limited() -> _Lookup:
+            async with semaphore:
+                result, versions = await lookup()
+
+            # Cached by the lookup itself, so it counts even if the caller gave up
+            if result.get("exists") or result.get("error") in _DEFINITIVE_ERRORS:
+                fetch_cache[run_key] = (dict(result), versions)
+                self._check_cache[key] = (
+                    time.monotonic() + self._check_cache_ttl,
+                    (dict(result), versions),
+                )
+                if len(self._check_cache) > self._check_cache_maxsize:
+                    self._check_cache.popitem(last=False)
+            return result, versions
+
+        def _finished(task: "asyncio.Future[_Lookup]") -> None:
+            if self._in_flight.get(key) is task:
+                del self._in_flight[key]
+            if not task.cancelled():
+                task.exception()  # Retrieved here in case every caller was cancelled
+
+        task = asyncio.ensure_future(_limited())
+        self._in_flight[key] = task
+        task.add_done_callback(_finished)
+
+        result, versions = await self._wait_shared(task)
+        return dict(result), versions
+
+    @classmethod
+    async def _wait_shared(cls, task: "asyncio.Future[_Lookup]") -> _Lookup:
+        """Await a shared lookup without letting one caller cancel it for the others.
+
+        A cancelled caller (fail-fast or its timeout) only detaches; the lookup
+        itself is cancelled once nobody is waiting for it any more.
+        """
+        cls._waiters[task] = cls._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            cls._waiters[task] -= 1
+            if not cls._waiters[task]:
+                del cls._waiters[task]
+                task.cancel()  # No-op once the lookup has finished
+
     @property
     def name(self) -> str:
         return "registry"
@@ -462,75 +1052,8 @@ class RegistryValidator(BaseValidator):
                 execution_time=time.time() - start_time,
             )
 
-        debug_log("Creating HTTP session for registry requests")
-        async with aiohttp.ClientSession() as session:
-            for i, package in enumerate(packages_to_validate, 1):
-                debug_log(
-                    f"Processing package {i}/{len(packages_to_validate)}: {package.name} ({package.registry_type})"
-                )
-                checker = self.checkers.get(package.registry_type)
-                if not checker:
-                    debug_log(f"Unsupported registry type: {package.registry_type}", "ERROR")
-                    errors.append(
-                        f"Unsupported registry type: {package.registry_type} for package {package.name}"
-                    )
-                    data["registry_errors"] += 1
-                    continue
-
-                debug_log(f"Checking package {package.name} with {package.registry_type} checker")
-                result = await checker.check_package(package, session)
-                debug_log(
-                    f"Check result for {package.name}: exists={result.get('exists')}, error={result.get('error')}"
-                )
-                data["packages_checked"].append(result)
-
-                if result.get("exists", False):
-                    debug_log(f"Package {package.name} exists")
-                    data["packages_found"] += 1
-
-                    # Check specific version if requested
-                    if package.version:
-                        version_key = (
-                            "requested_version_exists"
-                            if package.registry_type != "docker"
-                            else "requested_tag_exists"
-                        )
-                        version_exists = result.get(version_key, True)
-                        debug_log(
-                            f"Version check for {package.name}@{package.version}: {version_exists}"
-                        )
-                        if not version_exists:
-                            warning_msg = f"Package {package.name} exists but version/tag {package.version} not found"
-                            debug_log(f"Adding warning: {warning_msg}", "WARN")
-                            warnings.append(warning_msg)
-
-                elif result.get("error"):
-                    # Network or registry errors - treat as warnings for transient issues
-                    error_msg = result.get("error", "")
-                    debug_log(f"Error for package {package.name}: {error_msg}")
-                    if "not found" in error_msg.lower() or "404" in error_msg:
-                        # Definitely missing package
-                        error_text = (
-                            f"Package {package.name} not found in {package.registry_type} registry"
-                        )
-                        debug_log(f"Adding error (missing package): {error_text}", "ERROR")
-                        errors.append(error_text)
-                        data["packages_missing"] += 1
-                    else:
-                        # Network or other errors
-                        warning_text = f"Could not verify package {package.name}: {error_msg}"
-                        debug_log(f"Adding warning (network error): {warning_text}", "WARN")
-                        warnings.append(warning_text)
-                        data["registry_errors"] += 1
-
-                else:
-                    # Package definitely doesn't exist
-                    error_text = (
-                        f"Package {package.name} not found in {package.registry_type} registry"
-                    )
-                    debug_log(f"Adding error (no exists flag): {error_text}", "ERROR")
-                    errors.append(error_text)
-                    data["packages_missing"] += 1
+        session = self.session or context.http_session or _get_shared_session()
+        await self._check_packages(packages_to_validate, session, context, data, errors, warnings)
 
         # Validation passes if all required packages exist (no errors)
         passed = len(errors) == 0
@@ -557,6 +1080,139 @@ class RegistryValidator(BaseValidator):
             execution_time=execution_time,
         )
 
+    async def _check_packages(
+        self,
+        packages_to_validate: List[PackageInfo],
+        session: aiohttp.ClientSession,
+        context: ValidationContext,
+        data: Dict[str, Any],
+        errors: List[str],
+        warnings: List[str],
+    ) -> None:
+        """Check each package against its registry, recording results in place.
+
+        Registry requests are issued concurrently, at most ``max_concurrency``
+        at a time, and each check is bounded by the context timeout. In
+        fail-fast mode the remaining checks are cancelled once a package turns
+        out to be missing. Results are processed in package order so errors
+        and warnings stay deterministic.
+
+        Repeated (type, name, version) entries are checked once and the result
+        is reported for every occurrence.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        checkers = [self.checkers.get(package.registry_type) for package in packages_to_validate]
+
+        # Index of each package's check in ``checks``; None for unsupported registries
+        check_index: List[Optional[int]] = []
+        unique: Dict[Tuple[str, str, Optional[str]], int] = {}
+        checks = []
+        for package, checker in zip(packages_to_validate, checkers):
+            if not checker:
+                check_index.append(None)
+                continue
+            key = (package.registry_type, package.name, package.version)
+            if key not in unique:
+                unique[key] = len(checks)
+                checks.append(
+                    asyncio.wait_for(
+                        self._cached_check(
+                            checker, package, session, semaphore, context.fetch_cache
+                        ),
+                        context.timeout,
+                    )
+                )
+            check_index.append(unique[key])
+
+        if context.fail_fast:
+            check_results = await _gather_until_missing(checks)
+        else:
+            check_results = await asyncio.gather(*checks, return_exceptions=True)
+        # Tallied in locals during the single pass and stored in data at the end
+        found = missing = registry_errors = skipped = 0
+
+        for i, (package, checker, index) in enumerate(
+            zip(packages_to_validate, checkers, check_index), 1
+        ):
+            debug_log(
+                f"Processing package {i}/{len(packages_to_validate)}: {package.name} ({package.registry_type})"
+            )
+            if not checker:
+                debug_log(f"Unsupported registry type: {package.registry_type}", "ERROR")
+                errors.append(
+                    f"Unsupported registry type: {package.registry_type} for package {package.name}"
+                )
+                registry_errors += 1
+                continue
+
+            result = check_results[index]
+            if result is None:
+                debug_log(f"Check for {package.name} cancelled after an earlier failure")
+                skipped += 1
+                continue
+            if isinstance(result, BaseException):
+                result = _failed_check(package, checker, result)
+            debug_log(
+                f"Check result for {package.name}: exists={result.get('exists')}, error={result.get('error')}"
+            )
+            data["packages_checked"].append(result)
+
+            if result.get("exists", False):
+                debug_log(f"Package {package.name} exists")
+                found += 1
+
+                # Check specific version if requested
+                if package.version:
+                    version_key = (
+                        "requested_version_exists"
+                        if package.registry_type != "docker"
+                        else "requested_tag_exists"
+                    )
+                    version_exists = result.get(version_key, True)
+                    debug_log(
+                        f"Version check for {package.name}@{package.version}: {version_exists}"
+                    )
+                    if not version_exists:
+                        warning_msg = f"Package {package.name} exists but version/tag {package.version} not found"
+                        debug_log(f"Adding warning: {warning_msg}", "WARN")
+                        warnings.append(warning_msg)
+
+            elif result.get("error"):
+                # Network or registry errors - treat as warnings for transient issues
+                error_msg = result.get("error", "")
+                debug_log(f"Error for package {package.name}: {error_msg}")
+                if _is_missing(result):
+                    # Definitely missing package
+                    error_text = (
+                        f"Package {package.name} not found in {package.registry_type} registry"
+                    )
+                    debug_log(f"Adding error (missing package): {error_text}", "ERROR")
+                    errors.append(error_text)
+                    missing += 1
+                else:
+                    # Network or other errors
+                    warning_text = f"Could not verify package {package.name}: {error_msg}"
+                    debug_log(f"Adding warning (network error): {warning_text}", "WARN")
+                    warnings.append(warning_text)
+                    registry_errors += 1
+
+            else:
+                # Package definitely doesn't exist
+                error_text = (
+                    f"Package {package.name} not found in {package.registry_type} registry"
+                )
+                debug_log(f"Adding error (no exists flag): {error_text}", "ERROR")
+                errors.append(error_text)
+                missing += 1
+
+        data["packages_found"] = found
+        data["packages_missing"] = missing
+        data["registry_errors"] = registry_errors
+        if skipped:
+            warnings.append(
+                f"Skipped {skipped} remaining package checks after a missing package (fail-fast)"
+            )
+
     def is_applicable(self, context: ValidationContext) -> bool:
         """Registry validation is applicable when packages are configured and enabled."""
         return self.enabled and len(self.packages) > 0
@@ -0,0 +1,57 @@
+"""Canned registry documents for offline registry validation.
+
+Used instead of the live registries when MCP_VALIDATION_TEST_OFFLINE is set,
+so test runs in CI do not depend on network access. Packages not listed here
+are reported as not found.
+"""
+
+from typing import Any, Dict, Tuple
+
+# (registry type, name) -> npm/PyPI "versions" and "latest", or Docker "tags"
+OFFLINE_PACKAGES: Dict[Tuple[str, str], Dict[str, Any]] = {
+    ("npm", "lodash"): {
+        "versions": ("4.17.19", "4.17.20", "4.17.21"),
+        "latest": "4.17.21",
+        "description": "Lodash modular utilities.",
+    },
+    ("npm", "express"): {
+        "versions": ("4.18.0", "4.18.2", "4.19.2", "4.21.2", "5.1.0"),
+        "latest": "5.1.0",
+        "description": "Fast, unopinionated, minimalist web framework",
+    },
+    ("npm", "typescript"): {
+        "versions": ("4.9.5", "5.0.0", "5.4.5", "5.8.3"),
+        "latest": "5.8.3",
+        "description": "TypeScript is a language for application scale JavaScript development",
+    },
+    ("npm", "@dynatrace-oss/dynatrace-mcp-server"): {
+        "versions": ("0.4.0", "0.5.0"),
+        "latest": "0.5.0",
+        "description": "Model Context Protocol (MCP) server for Dynatrace",
+    },
+    ("pypi", "requests"): {
+        "versions": ("2.28.2", "2.31.0", "2.32.3"),
+        "latest": "2.32.3",
+        "description": "Python HTTP for Humans.",
+    },
+    ("pypi", "flask"): {
+        "versions": ("2.3.3", "3.0.3", "3.1.0"),
+        "latest": "3.1.0",
+        "description": "A simple framework for building complex web applications.",
+    },
+    ("docker", "alpine"): {
+        "tags": ("latest", "3.20", "3.19", "3.18"),
+        "description": "A minimal Docker image based on Alpine Linux",
+        "is_official": True,
+    },
+    ("docker", "node"): {
+        "tags": ("latest", "lts", "22", "20"),
+        "description": "Node.js is a JavaScript-based platform for server-side applications.",
+        "is_official": True,
+    },
+    ("docker", "nginx"): {
+        "tags": ("latest", "stable", "mainline"),
+        "description": "Official build of Nginx.",
+        "is_official": True,
+    },
+}
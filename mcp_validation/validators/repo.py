@@ -21,6 +21,8 @@ def debug_log(message: str, level: str = "INFO") -> None:
 class RepoAvailabilityValidator(BaseValidator):
     """Validates that a repository URL is accessible and contains OSS project files."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "repo_availability"
@@ -300,6 +302,8 @@ class RepoAvailabilityValidator(BaseValidator):
 class LicenseValidator(BaseValidator):
     """Validates that the repository has an acceptable OSS license."""
 
+    __slots__ = ()
+
     # Acceptable OSS licenses for Red Hat
     ACCEPTABLE_LICENSES = {
         'apache-2.0': ['apache license 2.0', 'apache license version 2.0', 'apache-2.0'],
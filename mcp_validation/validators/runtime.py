@@ -19,6 +19,8 @@ def debug_log(message: str, level: str = "INFO") -> None:
 class RuntimeExistsValidator(BaseValidator):
     """Validates that the specified runtime command is available in the system PATH."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "runtime_exists"
@@ -211,6 +213,8 @@ class RuntimeExistsValidator(BaseValidator):
 class RuntimeExecutableValidator(BaseValidator):
     """Validates that the runtime command is executable by the current user."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "runtime_executable"
@@ -1,19 +1,87 @@
 """Security analysis validator using mcp-scan."""
 
 import asyncio
+import atexit
+import functools
 import json
 import os
 import shutil
 import tempfile
 import time
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..utils import fastjson
 from .base import BaseValidator, ValidationContext, ValidatorResult
 
+# Severity ordering used for the vulnerability threshold; unknown counts as low
+SEVERITY_LEVELS = MappingProxyType({"low": 1, "medium": 2, "high": 3, "critical": 4})
+_MAX_SEVERITY_LEVEL = max(SEVERITY_LEVELS.values())
+
+# How much of mcp-scan's stderr to keep in a failure warning
+_STDERR_TAIL_BYTES = 4096
+
+
+@functools.lru_cache(maxsize=1)
+def _tool_paths() -> Tuple[Optional[str], Optional[str]]:
+    """Resolve (mcp-scan, uvx) executable paths once per process."""
+    return shutil.which("mcp-scan"), shutil.which("uvx")
+
+
+# Get command from context (need to reconstruct from process)
+# For now, use a simplified approach
+_SCAN_CONFIG: Dict[str, Any] = {
+    "mcpServers": {
+        "test-server": {
+            "command": "echo",  # Placeholder - this needs the actual command
+            "args": ["MCP server placeholder"],
+        }
+    }
+}
+
+# The mcp-scan config file shared by every SecurityValidator in the process;
+# written on first use and removed at exit
+_scan_config_path: Optional[str] = None
+
+
+def _scan_config_file() -> str:
+    """Return the mcp-scan config path, writing the file once per process.
+
+    The config never changes, so concurrent scans only ever read a complete file.
+    """
+    global _scan_config_path
+    if _scan_config_path is None:
+        fd, path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "wb") as f:
+            f.write(fastjson.dumps(_SCAN_CONFIG, indent=True))
+        _scan_config_path = path
+        atexit.register(_remove_scan_config)
+    return _scan_config_path
+
+
+def _remove_scan_config() -> None:
+    """Delete the shared mcp-scan config file."""
+    global _scan_config_path
+    if _scan_config_path is None:
+        return
+
+    atexit.unregister(_remove_scan_config)
+    try:
+        os.unlink(_scan_config_path)
+    except OSError:
+        pass
+    _scan_config_path = None
+
 
 class SecurityValidator(BaseValidator):
     """Validates MCP server security using mcp-scan analysis."""
 
+    __slots__ = ("_mcp_scan", "_uvx", "_available")
+
+    def __init__(self, config: Dict[str, Any] = None):
+        super().__init__(config)
+        self._detect_tools()
+
     @property
     def name(self) -> str:
         return "security"
@@ -36,9 +104,24 @@ class SecurityValidator(BaseValidator):
 
         return self._check_mcp_scan_available()
 
+    @classmethod
+    def clear_tool_cache(cls) -> None:
+        """Forget cached tool locations (e.g. after PATH changes in tests)."""
+        _tool_paths.cache_clear()
+
+    def refresh(self) -> None:
+        """Re-detect mcp-scan and uvx, e.g. after PATH changes in tests."""
+        self.clear_tool_cache()
+        self._detect_tools()
+
+    def _detect_tools(self) -> None:
+        """Record tool locations; PATH is only walked once per process."""
+        self._mcp_scan, self._uvx = _tool_paths()
+        self._available = bool(self._mcp_scan or self._uvx)
+
     def _check_mcp_scan_available(self) -> bool:
         """Check if mcp-scan tool is available."""
-        return shutil.which("mcp-scan") is not None or shutil.which("uvx") is not None
+        return self._available
 
     async def validate(self, context: ValidationContext) -> ValidatorResult:
         """Execute security validation."""
@@ -75,17 +158,21 @@ class SecurityValidator(BaseValidator):
                 data["scan_file"] = scan_file
 
                 # Parse scan results
-                tools_scanned, vulnerabilities = self._parse_scan_results(scan_results)
+                (
+                    tools_scanned,
+                    vulnerabilities,
+                    vulnerability_types,
+                    risk_levels,
+                    max_level,
+                ) = self._parse_scan_results(scan_results)
                 data["tools_scanned"] = tools_scanned
                 data["vulnerabilities_found"] = len(vulnerabilities)
-                data["vulnerability_types"] = list(
-                    {v.get("type", "unknown") for v in vulnerabilities}
-                )
-                data["risk_levels"] = list({v.get("severity", "unknown") for v in vulnerabilities})
+                data["vulnerability_types"] = vulnerability_types
+                data["risk_levels"] = risk_levels
 
                 # Check vulnerability threshold
                 threshold = self.config.get("vulnerability_threshold", "high")
-                if self._check_vulnerability_threshold(vulnerabilities, threshold):
+                if max_level >= SEVERITY_LEVELS.get(threshold.lower(), 3):
                     warnings.append(f"Vulnerabilities found exceed {threshold} threshold")
 
         except Exception as e:
@@ -107,85 +194,72 @@ class SecurityValidator(BaseValidator):
     ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """Run mcp-scan security analysis on the server."""
 
-        # Create temporary MCP configuration file for mcp-scan
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as config_file:
-            # Get command from context (need to reconstruct from process)
-            # For now, use a simplified approach
-            config = {
-                "mcpServers": {
-                    "test-server": {
-                        "command": "echo",  # Placeholder - this needs the actual command
-                        "args": ["MCP server placeholder"],
-                    }
-                }
-            }
-
-            json.dump(config, config_file, indent=2)
-            config_path = config_file.name
-
-        try:
-            # Try uvx mcp-scan first, then fall back to mcp-scan
-            scan_cmd = None
-            if shutil.which("uvx"):
-                scan_cmd = [
-                    "uvx",
-                    "mcp-scan@latest",
-                    "--json",
-                    "--suppress-mcpserver-io",
-                    "true",
-                    config_path,
-                ]
-            elif shutil.which("mcp-scan"):
-                scan_cmd = ["mcp-scan", "--json", "--suppress-mcpserver-io", "true", config_path]
-
-            if not scan_cmd:
-                warnings.append("mcp-scan tool not available")
-                return None, None
-
-            # Run mcp-scan with timeout
-            timeout = self.config.get("timeout", 60.0)
-            process = await asyncio.create_subprocess_exec(
-                *scan_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-            )
-
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
-
-            if process.returncode == 0:
-                try:
-                    scan_results = json.loads(stdout.decode())
-
-                    # Save scan results to a timestamped file if configured
-                    scan_filename = None
-                    if self.config.get("save_scan_results", False):
-                        import datetime
-
-                        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                        scan_filename = f"mcp-scan-results_{timestamp}.json"
+        scan_cmd = self._scan_command()
+        if not scan_cmd:
+            warnings.append("mcp-scan tool not available")
+            return None, None
+        scan_cmd.append(_scan_config_file())
 
-                        with open(scan_filename, "w") as scan_file:
-                            json.dump(scan_results, scan_file, indent=2)
+        # Run mcp-scan with timeout
+        timeout = self.config.get("timeout", 60.0)
+        process = await asyncio.create_subprocess_exec(
+            *scan_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
 
-                    return scan_results, scan_filename
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
 
-                except json.JSONDecodeError as e:
-                    warnings.append(f"mcp-scan output parsing failed: {e}")
-                    return None, None
-            else:
-                error_msg = stderr.decode().strip()
-                warnings.append(f"mcp-scan failed: {error_msg}")
-                return None, None
-
-        finally:
-            # Clean up temporary config file
+        if process.returncode == 0:
             try:
-                os.unlink(config_path)
-            except Exception:
-                pass
-
-    def _parse_scan_results(self, scan_results: Dict[str, Any]) -> Tuple[int, List[Dict[str, Any]]]:
-        """Parse mcp-scan results to extract metrics."""
+                # Parse the raw bytes; avoids a full decoded str copy of the output
+                scan_results = fastjson.loads(stdout)
+
+                # Save scan results to a timestamped file if configured
+                scan_filename = None
+                if self.config.get("save_scan_results", False):
+                    t = time.localtime()
+                    timestamp = (
+                        f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}"
+                        f"_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
+                    )
+                    scan_filename = f"mcp-scan-results_{timestamp}.json"
+
+                    with open(scan_filename, "wb") as scan_file:
+                        scan_file.write(fastjson.dumps(scan_results, indent=True))
+
+                return scan_results, scan_filename
+
+            except json.JSONDecodeError as e:
+                warnings.append(f"mcp-scan output parsing failed: {e}")
+                return None, None
+        else:
+            # Only the tail matters for the warning; chatty scans can emit a lot of progress output
+            error_msg = stderr[-_STDERR_TAIL_BYTES:].decode("utf-8", "replace").strip()
+            warnings.append(f"mcp-scan failed: {error_msg}")
+            return None, None
+
+    def _scan_command(self) -> Optional[List[str]]:
+        """Build the mcp-scan argv (without the config path), preferring uvx."""
+        if self._uvx:
+            return ["uvx", "mcp-scan@latest", "--json", "--suppress-mcpserver-io", "true"]
+        if self._mcp_scan:
+            return ["mcp-scan", "--json", "--suppress-mcpserver-io", "true"]
+        return None
+
+    def _parse_scan_results(
+        self, scan_results: Dict[str, Any]
+    ) -> Tuple[int, List[Dict[str, Any]], List[str], List[str], int]:
+        """Parse mcp-scan results to extract metrics.
+
+        Returns tools scanned, vulnerabilities, their distinct types and
+        severities in first-seen order, and the highest severity level seen
+        (0 if none).
+        """
         tools_scanned = 0
         vulnerabilities = []
+        # Dicts as insertion-ordered sets keep report output deterministic
+        vulnerability_types: Dict[str, None] = {}
+        risk_levels: Dict[str, None] = {}
+        max_level = 0
 
         for _config_path, config_data in scan_results.items():
             if "servers" in config_data:
@@ -195,27 +269,21 @@ class SecurityValidator(BaseValidator):
                     tools_scanned += len(tools)
 
                     # Look for vulnerabilities in the signature
-                    server_vulns = signature.get("vulnerabilities", [])
-                    vulnerabilities.extend(server_vulns)
-
-        return tools_scanned, vulnerabilities
-
-    def _check_vulnerability_threshold(
-        self, vulnerabilities: List[Dict[str, Any]], threshold: str
-    ) -> bool:
-        """Check if vulnerabilities exceed the specified threshold."""
-        if not vulnerabilities:
-            return False
-
-        severity_levels = {"low": 1, "medium": 2, "high": 3, "critical": 4}
-
-        threshold_level = severity_levels.get(threshold.lower(), 3)
-
-        for vuln in vulnerabilities:
-            vuln_severity = vuln.get("severity", "unknown").lower()
-            vuln_level = severity_levels.get(vuln_severity, 1)
-
-            if vuln_level >= threshold_level:
-                return True
-
-        return False
+                    for vuln in signature.get("vulnerabilities", []):
+                        vulnerabilities.append(vuln)
+                        severity = vuln.get("severity", "unknown")
+                        vulnerability_types[vuln.get("type", "unknown")] = None
+                        risk_levels[severity] = None
+                        # Nothing outranks critical, so stop looking up levels once seen
+                        if max_level < _MAX_SEVERITY_LEVEL:
+                            level = SEVERITY_LEVELS.get(severity.lower(), 1)
+                            if level > max_level:
+                                max_level = level
+
+        return (
+            tools_scanned,
+            vulnerabilities,
+            list(vulnerability_types),
+            list(risk_levels),
+            max_level,
+        )
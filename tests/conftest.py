@@ -0,0 +1,130 @@
+"""Shared pytest fixtures."""
+
+import io
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pytest_asyncio import is_async_test
+
+from mcp_validation.utils.debug import set_debug_enabled
+from mcp_validation.validators.base import ValidationContext
+from mcp_validation.validators.registry import RegistryValidator, close_shared_session
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Real packages most network tests look up; checked once before any of them run
+WARM_PACKAGES = [
+    {"name": "lodash", "type": "npm"},
+    {"name": "express", "type": "npm"},
+    {"name": "requests", "type": "pypi"},
+    {"name": "alpine", "type": "docker", "version": "latest"},
+]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests marked 'network' that talk to live package registries",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # One event loop for the whole run; the loop_scope marker works on every
+    # pytest-asyncio release that still installs on Python 3.8
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+    if config.getoption("--run-network"):
+        return
+
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _registry_cache_dir(tmp_path_factory):
+    """Keep registry documents fetched by tests out of the user's cache directory."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("MCP_VALIDATION_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        yield
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _warm_registry_cache(request, _close_shared_registry_session):
+    """Seed the process-wide registry cache when live-registry tests will run."""
+    if request.config.getoption("--run-network"):
+        context = ValidationContext(process=None, server_info={}, capabilities={}, timeout=30.0)
+        await RegistryValidator({"packages": WARM_PACKAGES}).validate(context)
+    yield
+
+
+@pytest.fixture
+def buffered_stdout():
+    """Collect a chatty test's print() output and write it once at teardown."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        yield
+    sys.stdout.write(buffer.getvalue())
+
+
+@pytest.fixture
+def debug_enabled():
+    """Enable debug output for the duration of a test."""
+    set_debug_enabled(True)
+    yield
+    set_debug_enabled(False)
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _close_shared_registry_session():
+    """Close the process-wide registry session before the session loop ends."""
+    yield
+    await close_shared_session()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def registry_session():
+    """One aiohttp session shared by registry tests so connections are reused."""
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+def _fixture_response(registry: str, name: str) -> web.Response:
+    """Serve tests/fixtures/<registry>/<name>.json, or 404 if there is none."""
+    path = FIXTURES_DIR / registry / f"{name}.json"
+    if path.is_file():
+        return web.Response(body=path.read_bytes(), content_type="application/json")
+    return web.json_response({"error": "Not found"}, status=404)
+
+
+@pytest_asyncio.fixture
+async def mocked_registries():
+    """Local npm/PyPI stand-in backed by tests/fixtures.
+
+    Yields a ``registries`` config for RegistryValidator pointing at the server.
+    """
+    async def npm(request):
+        return _fixture_response("npm", request.match_info["name"])
+
+    async def pypi(request):
+        return _fixture_response("pypi", request.match_info["name"])
+
+    app = web.Application()
+    app.router.add_get("/pypi/{name}/json", pypi)
+    app.router.add_get("/{name:.+}", npm)
+
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        yield {"npm_url": base_url, "pypi_url": base_url}
@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """Test that comprehensive profile runs registry validation first."""
 
+import pytest
+
 from mcp_validation.config.settings import ConfigurationManager
 
 
+@pytest.mark.usefixtures("buffered_stdout")
 def test_comprehensive_validation_order():
     """Test that comprehensive profile has registry validation first."""
     
@@ -54,7 +57,3 @@ def test_comprehensive_validation_order():
     print(f"   • Fail-fast on registry: {'YES' if not comprehensive_profile.continue_on_failure else 'NO'}")
     print(f"   • Total validators: {len(validators_list)}")
     print(f"   • Required validators: {sum(1 for _, config in validators_list if config.required)}")
-
-
-if __name__ == "__main__":
-    test_comprehensive_validation_order()
\ No newline at end of file
@@ -1,38 +1,103 @@
 """Tests for container image validators."""
 
 import asyncio
+import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
+from mcp_validation.cli.main import detect_runtime_command, is_container_runtime_command
+from mcp_validation.validators import container
 from mcp_validation.validators.container import ContainerUBIValidator, ContainerVersionValidator
-from mcp_validation.validators.base import ValidationContext
+
+# Canned `<runtime> image inspect` output shared by the subprocess mocks
+UBUNTU_INSPECT_BYTES = (
+    b'[{"Config": {"Labels": {"name": "ubuntu", "description": "Ubuntu base image"}, "Env": []}}]'
+)
+UBI9_INSPECT_BYTES = (
+    b'[{"Config": {"Labels": {"name": "ubi9/ubi", "com.redhat.component": "ubi9-container"},'
+    b' "Env": ["REDHAT_SUPPORT_PRODUCT=ubi"]}}]'
+)
+
+
+def _inspection(inspect_bytes):
+    """Build the _inspect_image() result for a canned inspect payload."""
+    config = json.loads(inspect_bytes)[0]["Config"]
+    return {
+        "image_inspected": True,
+        "inspection_output": None,
+        "image_labels": config["Labels"],
+        "image_env": config["Env"],
+        "error": None,
+    }
+
+
+UBUNTU_INSPECTION = _inspection(UBUNTU_INSPECT_BYTES)
+UBI9_INSPECTION = _inspection(UBI9_INSPECT_BYTES)
+
+
+class _StubProc:
+    """Finished subprocess stand-in whose communicate() returns canned stdout."""
+
+    def __init__(self, stdout, returncode=0):
+        self._out = stdout
+        self.returncode = returncode
+
+    async def communicate(self):
+        return self._out, b""
+
+
+def _context(command_args):
+    """Build a lightweight stand-in for ValidationContext."""
+    return SimpleNamespace(
+        command_args=command_args,
+        timeout=30.0,
+        process=None,
+        server_info={},
+        capabilities={},
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_inspect_cache():
+    """Keep cached image inspections from leaking between tests."""
+    ContainerUBIValidator.clear_inspect_cache()
+    yield
+    ContainerUBIValidator.clear_inspect_cache()
 
 
 @pytest.fixture
-def mock_context():
-    """Create a mock validation context."""
-    context = MagicMock(spec=ValidationContext)
-    context.command_args = ["docker", "run", "-i", "--rm", "hashicorp/terraform-mcp-server"]
-    context.timeout = 30.0
-    return context
+def patch_inspect(monkeypatch):
+    """Stub ContainerUBIValidator._inspect_image with a canned result."""
+    def _set(inspection):
+        monkeypatch.setattr(
+            ContainerUBIValidator, "_inspect_image", AsyncMock(return_value=inspection)
+        )
+    return _set
 
 
 @pytest.fixture
+def make_context():
+    """Factory for tests that need a context with their own command."""
+    return _context
+
+
+@pytest.fixture(scope="module")
+def mock_context():
+    """Create a docker validation context."""
+    return _context(["docker", "run", "-i", "--rm", "hashicorp/terraform-mcp-server"])
+
+
+@pytest.fixture(scope="module")
 def mock_context_podman():
-    """Create a mock validation context for podman."""
-    context = MagicMock(spec=ValidationContext)
-    context.command_args = ["podman", "run", "-i", "--rm", "registry.redhat.io/ubi9/ubi:latest"]
-    context.timeout = 30.0
-    return context
+    """Create a validation context for podman."""
+    return _context(["podman", "run", "-i", "--rm", "registry.redhat.io/ubi9/ubi:latest"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_context_non_container():
-    """Create a mock validation context for non-container command."""
-    context = MagicMock(spec=ValidationContext)
-    context.command_args = ["python", "server.py"]
-    context.timeout = 30.0
-    return context
+    """Create a validation context for non-container command."""
+    return _context(["python", "server.py"])
 
 
 class TestContainerUBIValidator:
@@ -86,7 +151,16 @@ class TestContainerUBIValidator:
         image_name = validator._extract_image_name(command_args)
         assert image_name is None
 
-    @pytest.mark.asyncio
+    def test_extract_image_name_cached(self):
+        """Test both container validators share one parse per command line."""
+        image = "quay.io/example/cached-image:1.2"
+        command_args = ["docker", "run", "--rm", image]
+        hits = container._extract_image_name.cache_info().hits
+
+        assert ContainerUBIValidator()._extract_image_name(command_args) == image
+        assert ContainerVersionValidator()._extract_image_name(list(command_args)) == image
+        assert container._extract_image_name.cache_info().hits == hits + 1
+
     async def test_validate_no_image_name(self, mock_context_non_container):
         """Test validation when image name cannot be extracted."""
         validator = ContainerUBIValidator({"enabled": True})
@@ -96,18 +170,10 @@ class TestContainerUBIValidator:
         assert len(result.errors) > 0
         assert "Could not extract container image name" in result.errors[0]
 
-    @pytest.mark.asyncio
-    @patch('mcp_validation.validators.container.asyncio.create_subprocess_exec')
-    async def test_validate_non_ubi_image_warn_only(self, mock_subprocess, mock_context):
+    async def test_validate_non_ubi_image_warn_only(self, patch_inspect, mock_context):
         """Test validation of a non-UBI image with warn_only=True (should pass with warning)."""
         # Mock successful image inspection for non-UBI image
-        mock_process = AsyncMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (
-            b'[{"Config": {"Labels": {"name": "ubuntu", "description": "Ubuntu base image"}, "Env": []}}]',
-            b''
-        )
-        mock_subprocess.return_value = mock_process
+        patch_inspect(UBUNTU_INSPECTION)
 
         validator = ContainerUBIValidator({"enabled": True, "warn_only_for_non_ubi": True})
         result = await validator.validate(mock_context)
@@ -119,18 +185,10 @@ class TestContainerUBIValidator:
         assert "not based on a UBI" in result.warnings[0]
         assert "Consider using a UBI-based image" in result.warnings[0]
 
-    @pytest.mark.asyncio
-    @patch('mcp_validation.validators.container.asyncio.create_subprocess_exec')
-    async def test_validate_non_ubi_image_strict_mode(self, mock_subprocess, mock_context):
+    async def test_validate_non_ubi_image_strict_mode(self, patch_inspect, mock_context):
         """Test validation of a non-UBI image with warn_only=False (should fail)."""
         # Mock successful image inspection for non-UBI image
-        mock_process = AsyncMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (
-            b'[{"Config": {"Labels": {"name": "ubuntu", "description": "Ubuntu base image"}, "Env": []}}]',
-            b''
-        )
-        mock_subprocess.return_value = mock_process
+        patch_inspect(UBUNTU_INSPECTION)
 
         validator = ContainerUBIValidator({"enabled": True, "warn_only_for_non_ubi": False})
         result = await validator.validate(mock_context)
@@ -141,18 +199,10 @@ class TestContainerUBIValidator:
         assert "not based on a UBI" in result.errors[0]
         assert "Consider using a UBI-based image" in result.errors[0]
 
-    @pytest.mark.asyncio
-    @patch('mcp_validation.validators.container.asyncio.create_subprocess_exec')
-    async def test_validate_ubi_compliant_image(self, mock_subprocess, mock_context):
+    async def test_validate_ubi_compliant_image(self, patch_inspect, mock_context):
         """Test validation of a UBI-compliant image."""
         # Mock successful image inspection
-        mock_process = AsyncMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (
-            b'[{"Config": {"Labels": {"name": "ubi9/ubi", "com.redhat.component": "ubi9-container"}, "Env": ["REDHAT_SUPPORT_PRODUCT=ubi"]}}]',
-            b''
-        )
-        mock_subprocess.return_value = mock_process
+        patch_inspect(UBI9_INSPECTION)
 
         validator = ContainerUBIValidator({"enabled": True})
         result = await validator.validate(mock_context)
@@ -161,6 +211,90 @@ class TestContainerUBIValidator:
         assert result.data["is_ubi_based"]
         assert result.data["rhel_version"] == "9"
 
+    @patch('mcp_validation.validators.container.asyncio.create_subprocess_exec')
+    async def test_inspect_image_parses_output(self, mock_subprocess):
+        """Test pull + inspect output is parsed into labels and environment."""
+        mock_subprocess.return_value = _StubProc(UBI9_INSPECT_BYTES)
+
+        result = await ContainerUBIValidator()._inspect_image("docker", "ubi9/ubi")
+
+        assert mock_subprocess.call_count == 2  # pull, then inspect
+        assert result["image_inspected"]
+        assert result["image_labels"] == UBI9_INSPECTION["image_labels"]
+        assert result["image_env"] == UBI9_INSPECTION["image_env"]
+
+    @patch('mcp_validation.validators.container.asyncio.create_subprocess_exec')
+    async def test_inspect_parses_bytes_without_decode(self, mock_subprocess, monkeypatch):
+        """Test a large inspect payload is parsed straight from the stdout bytes."""
+        labels = {f"org.example.label{i}": "x" * 100 for i in range(10000)}
+        payload = json.dumps([{"Config": {"Labels": labels, "Env": []}}]).encode()
+        assert len(payload) > 1_000_000
+        mock_subprocess.return_value = _StubProc(payload)
+
+        seen = []
+        real_loads = container.fastjson.loads
+        monkeypatch.setattr(
+            container.fastjson, "loads", lambda data: seen.append(data) or real_loads(data)
+        )
+
+        result = await ContainerUBIValidator()._inspect_image("docker", "big/image")
+
+        assert seen == [payload]  # the bytes object itself, not a decoded str
+        assert result["image_labels"] == labels
+        assert len(result["inspection_output"]) <= 2000
+
+    @patch('mcp_validation.validators.container.asyncio.create_subprocess_exec')
+    async def test_inspect_image_cached(self, mock_subprocess, mock_context):
+        """Test validating the same image twice pulls and inspects it only once."""
+        mock_subprocess.return_value = _StubProc(UBI9_INSPECT_BYTES)
+        validator = ContainerUBIValidator({"enabled": True})
+
+        first = await validator.validate(mock_context)
+        second = await ContainerUBIValidator({"enabled": True}).validate(mock_context)
+
+        assert mock_subprocess.call_count == 2  # one pull + one inspect in total
+        assert first.data["is_ubi_based"] and second.data["is_ubi_based"]
+
+    @patch('mcp_validation.validators.container.asyncio.create_subprocess_exec')
+    async def test_failed_inspection_not_cached(self, mock_subprocess):
+        """Test failed inspections are retried on the next call."""
+        mock_subprocess.return_value = _StubProc(b"", returncode=1)
+        validator = ContainerUBIValidator()
+
+        await validator._inspect_image("docker", "missing/image")
+        await validator._inspect_image("docker", "missing/image")
+
+        assert mock_subprocess.call_count == 4
+
+    async def test_validate_batch_parallel(self, make_context):
+        """Test a batch of validations overlaps the slow runtime calls."""
+        active = peak = 0
+
+        class _SlowProc(_StubProc):
+            async def communicate(self):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return await super().communicate()
+
+        contexts = [
+            make_context(["docker", "run", "--rm", f"example/image-{i}:1.0"]) for i in range(8)
+        ]
+
+        with patch(
+            "mcp_validation.validators.container.asyncio.create_subprocess_exec",
+            return_value=_SlowProc(UBI9_INSPECT_BYTES),
+        ):
+            results = await ContainerUBIValidator({"enabled": True}).validate_batch(contexts)
+
+        assert peak > 1  # Run one after another, at most one call is ever in flight
+        assert [r.data["image_name"] for r in results] == [
+            f"example/image-{i}:1.0" for i in range(8)
+        ]
+        assert all(r.data["is_ubi_based"] for r in results)
+
     def test_check_ubi_compliance_ubi9(self):
         """Test UBI compliance checking for UBI 9 image."""
         validator = ContainerUBIValidator()
@@ -180,6 +314,33 @@ class TestContainerUBIValidator:
         assert result["rhel_version"] == "9"
         assert result["base_image"] == "ubi9/ubi"
 
+    @pytest.mark.parametrize(
+        "name,rhel_version",
+        [("ubi8/ubi", "8"), ("ubi9/ubi", "9"), ("ubi9-minimal", "9"), ("ubi10/ubi-micro", "10")],
+    )
+    def test_check_ubi_compliance_versions(self, name, rhel_version):
+        """Test RHEL version extraction from UBI image names."""
+        inspection_result = {"image_inspected": True, "image_labels": {"name": name}, "image_env": []}
+
+        result = ContainerUBIValidator()._check_ubi_compliance(inspection_result)
+
+        assert result["is_ubi_based"]
+        assert result["rhel_version"] == rhel_version
+
+    def test_check_ubi_compliance_env_only(self):
+        """Test an env var alone marks the image as UBI-based."""
+        inspection_result = {
+            "image_inspected": True,
+            "image_labels": {"name": "custom", "vendor": "Red Hat"},
+            "image_env": ["REDHAT_SUPPORT_PRODUCT=ubi"],
+        }
+
+        result = ContainerUBIValidator()._check_ubi_compliance(inspection_result)
+
+        assert result["is_ubi_based"]
+        assert result["rhel_version"] is None
+        assert result["ubi_details"] == {"env_REDHAT_SUPPORT_PRODUCT": "REDHAT_SUPPORT_PRODUCT=ubi"}
+
     def test_check_ubi_compliance_non_ubi(self):
         """Test UBI compliance checking for non-UBI image."""
         validator = ContainerUBIValidator()
@@ -245,33 +406,35 @@ class TestContainerVersionValidator:
         assert result["image_repository"] == "hashicorp/terraform-mcp-server"
         assert result["image_tag"] == "latest"
 
-    @pytest.mark.asyncio
-    async def test_validate_latest_tag(self, mock_context):
+    def test_parse_image_name_returns_copy(self):
+        """Test callers cannot corrupt the cached parse by mutating the result."""
+        validator = ContainerVersionValidator()
+        validator._parse_image_name("quay.io/example/parsed:2.0")["image_tag"] = "mutated"
+
+        assert validator._parse_image_name("quay.io/example/parsed:2.0")["image_tag"] == "2.0"
+
+    async def test_validate_latest_tag(self, make_context):
         """Test validation of image using latest tag."""
-        # Update context to use latest tag
-        mock_context.command_args = ["docker", "run", "-i", "--rm", "hashicorp/terraform-mcp-server:latest"]
-        
+        context = make_context(["docker", "run", "-i", "--rm", "hashicorp/terraform-mcp-server:latest"])
+
         validator = ContainerVersionValidator({"enabled": True})
-        result = await validator.validate(mock_context)
+        result = await validator.validate(context)
         
         assert result.passed
         assert result.data["using_latest"]
         assert result.data["image_tag"] == "latest"
 
-    @pytest.mark.asyncio
-    async def test_validate_specific_tag(self, mock_context):
+    async def test_validate_specific_tag(self, make_context):
         """Test validation of image using specific tag."""
-        # Update context to use specific tag
-        mock_context.command_args = ["docker", "run", "-i", "--rm", "hashicorp/terraform-mcp-server:v1.0"]
-        
+        context = make_context(["docker", "run", "-i", "--rm", "hashicorp/terraform-mcp-server:v1.0"])
+
         validator = ContainerVersionValidator({"enabled": True})
-        result = await validator.validate(mock_context)
+        result = await validator.validate(context)
         
         assert result.passed  # Should pass but may have warnings
         assert not result.data["using_latest"]
         assert result.data["image_tag"] == "v1.0"
 
-    @pytest.mark.asyncio
     async def test_validate_no_image_name(self, mock_context_non_container):
         """Test validation when image name cannot be extracted."""
         validator = ContainerVersionValidator({"enabled": True})
@@ -285,53 +448,28 @@ class TestContainerVersionValidator:
 class TestContainerDetection:
     """Test cases for container runtime detection in CLI."""
 
-    def test_detect_docker_run(self):
-        """Test detection of docker run command."""
-        from mcp_validation.cli.main import is_container_runtime_command
-        
-        command_args = ["docker", "run", "-i", "--rm", "hashicorp/terraform-mcp-server"]
-        assert is_container_runtime_command(command_args)
-
-    def test_detect_podman_run(self):
-        """Test detection of podman run command."""
-        from mcp_validation.cli.main import is_container_runtime_command
-        
-        command_args = ["podman", "run", "-i", "--rm", "registry.redhat.io/ubi9/ubi:latest"]
-        assert is_container_runtime_command(command_args)
-
-    def test_detect_non_container_command(self):
-        """Test non-container commands are not detected."""
-        from mcp_validation.cli.main import is_container_runtime_command
-        
-        command_args = ["python", "server.py"]
-        assert not is_container_runtime_command(command_args)
-
-    def test_detect_docker_without_run(self):
-        """Test docker commands without run are not detected."""
-        from mcp_validation.cli.main import is_container_runtime_command
-        
-        command_args = ["docker", "ps"]
-        assert not is_container_runtime_command(command_args)
-
-    def test_detect_short_command(self):
-        """Test short commands are not detected."""
-        from mcp_validation.cli.main import is_container_runtime_command
-        
-        command_args = ["docker"]
-        assert not is_container_runtime_command(command_args)
-
-    def test_detect_runtime_command_docker(self):
-        """Test runtime command detection for docker."""
-        from mcp_validation.cli.main import detect_runtime_command
-        
-        command_args = ["docker", "run", "-i", "--rm", "hashicorp/terraform-mcp-server"]
-        runtime = detect_runtime_command(command_args)
-        assert runtime == "docker"
-
-    def test_detect_runtime_command_podman(self):
-        """Test runtime command detection for podman.""" 
-        from mcp_validation.cli.main import detect_runtime_command
-        
-        command_args = ["podman", "run", "-i", "--rm", "registry.redhat.io/ubi9/ubi:latest"]
-        runtime = detect_runtime_command(command_args)
-        assert runtime == "podman"
\ No newline at end of file
+    @pytest.mark.parametrize(
+        "command_args,is_container,runtime",
+        [
+            (["docker", "run", "-i", "--rm", "hashicorp/terraform-mcp-server"], True, "docker"),
+            (["podman", "run", "-i", "--rm", "registry.redhat.io/ubi9/ubi:latest"], True, "podman"),
+            (["nerdctl", "run", "-i", "--rm", "ghcr.io/example/mcp-server:1.0"], True, "nerdctl"),
+            (["nerdctl", "ps"], False, None),
+            (["python", "server.py"], False, "python"),
+            (["docker", "ps"], False, "docker"),
+            (["docker"], False, "docker"),
+        ],
+        ids=[
+            "docker-run",
+            "podman-run",
+            "nerdctl-run",
+            "nerdctl-without-run",
+            "non-container",
+            "docker-without-run",
+            "short",
+        ],
+    )
+    def test_container_detection(self, command_args, is_container, runtime):
+        """Test container run detection and the runtime detected for each command."""
+        assert is_container_runtime_command(command_args) is is_container
+        assert detect_runtime_command(command_args) == runtime
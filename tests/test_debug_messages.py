@@ -1,112 +1,137 @@
 #!/usr/bin/env python3
 """Test the debug messages in registry validator."""
 
-import asyncio
-import os
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Dict, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from mcp_validation.validators import registry
 from mcp_validation.validators.registry import RegistryValidator
 from mcp_validation.validators.base import ValidationContext
 from mcp_validation.utils.debug import set_debug_enabled
 
+@dataclass(frozen=True)
+class Scenario:
+    """A registry validation scenario and its expected offline outcome."""
+
+    name: str
+    passed: bool
+    found: int
+    packages: Tuple[Dict[str, str], ...]
+    warning: Optional[str] = None
+
+
+SCENARIOS = (
+    Scenario(
+        "Valid packages (should pass)",
+        passed=True,
+        found=2,
+        packages=(
+            {"name": "lodash", "type": "npm"},
+            {"name": "requests", "type": "pypi"},
+        ),
+    ),
+    Scenario(
+        "Invalid packages (should fail)",
+        passed=False,
+        found=0,
+        packages=(
+            {"name": "definitely-fake-npm-xyz", "type": "npm"},
+            {"name": "definitely-fake-pypi-abc", "type": "pypi"},
+        ),
+    ),
+    Scenario(
+        "Mixed scenario (should partially pass)",
+        passed=False,
+        found=1,
+        packages=(
+            {"name": "lodash", "type": "npm"},  # exists
+            {"name": "fake-package-999", "type": "npm"},  # doesn't exist
+        ),
+    ),
+    Scenario(
+        "Version validation (should warn)",
+        passed=True,
+        found=1,
+        warning="Package lodash exists but version/tag 999.999.999 not found",
+        packages=({"name": "lodash", "type": "npm", "version": "999.999.999"},),
+    ),
+    Scenario("No packages (should skip)", passed=True, found=0, packages=()),
+)
 
-async def test_debug_messages():
-    """Test debug messages with various scenarios."""
-    
-    print("🐛 Testing Registry Validator Debug Messages\n")
-    print("=" * 60)
-    
-    # Enable debug mode
-    set_debug_enabled(True)
-    
-    test_scenarios = [
-        {
-            "name": "Valid packages (should pass)",
-            "packages": [
-                {"name": "lodash", "type": "npm"},
-                {"name": "requests", "type": "pypi"}
-            ]
-        },
-        {
-            "name": "Invalid packages (should fail)",
-            "packages": [
-                {"name": "definitely-fake-npm-xyz", "type": "npm"},
-                {"name": "definitely-fake-pypi-abc", "type": "pypi"}
-            ]
-        },
-        {
-            "name": "Mixed scenario (should partially pass)",
-            "packages": [
-                {"name": "lodash", "type": "npm"},  # exists
-                {"name": "fake-package-999", "type": "npm"}  # doesn't exist
-            ]
-        },
-        {
-            "name": "Version validation (should warn)",
-            "packages": [
-                {"name": "lodash", "type": "npm", "version": "999.999.999"}
-            ]
-        },
-        {
-            "name": "No packages (should skip)",
-            "packages": []
-        }
-    ]
-    
-    context = ValidationContext(
+
+@pytest.fixture
+def context():
+    """Validation context without a running server."""
+    return ValidationContext(
         process=None,
         server_info={},
         capabilities={},
         timeout=30.0
     )
-    
-    for i, scenario in enumerate(test_scenarios, 1):
-        print(f"\n🧪 Test {i}: {scenario['name']}")
-        print("-" * 40)
-        
-        # Create validator
-        validator = RegistryValidator({
-            "enabled": True,
-            "packages": scenario["packages"]
-        })
-        
-        # Run validation with debug enabled
-        result = await validator.validate(context)
-        
-        print(f"\nSummary:")
-        print(f"  Result: {'✅ PASS' if result.passed else '❌ FAIL'}")
-        print(f"  Errors: {len(result.errors)}")
-        print(f"  Warnings: {len(result.warnings)}")
-        print(f"  Found: {result.data['packages_found']}/{result.data['total_packages']}")
-        
-        if result.errors:
-            print(f"  Error details:")
-            for error in result.errors:
-                print(f"    - {error}")
-        
-        print("\n" + "=" * 60)
-    
-    # Disable debug mode
-    print(f"\n🔇 Testing with debug disabled")
-    print("-" * 40)
-    set_debug_enabled(False)
-    
+
+
+@pytest.mark.network
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=attrgetter("name"))
+async def test_registry_scenario(scenario, context, registry_session, debug_enabled):
+    """Test each registry scenario with debug output enabled."""
     validator = RegistryValidator({
         "enabled": True,
-        "packages": [{"name": "fake-package-silent", "type": "npm"}]
+        "packages": list(scenario.packages)
+    }, session=registry_session)
+
+    result = await validator.validate(context)
+
+    assert result.data["total_packages"] == len(scenario.packages)
+    assert result.data["package_source"] == "configuration"
+    if not scenario.packages:
+        assert result.passed
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=attrgetter("name"))
+async def test_registry_scenario_offline(scenario, context, mocked_registries, debug_enabled):
+    """Test each registry scenario against the local fixture registries."""
+    validator = RegistryValidator({
+        "enabled": True,
+        "packages": list(scenario.packages),
+        "registries": mocked_registries,
     })
-    
-    print("Running validation (should be silent)...")
+
     result = await validator.validate(context)
-    print(f"Result: {'✅ PASS' if result.passed else '❌ FAIL'} (no debug output above)")
-    
-    print(f"\n📋 Debug Usage Instructions:")
-    print(f"To enable debug mode, use the --debug flag:")
-    print(f"  mcp-validate --debug -- python server.py")
-    print(f"  mcp-validate --debug -- npx mcp-server")
-    print(f"\nIn tests, use set_debug_enabled(True):")
-    print(f"  from mcp_validation.utils.debug import set_debug_enabled")
-    print(f"  set_debug_enabled(True)  # Enable debug output")
-    print(f"  set_debug_enabled(False) # Disable debug output")
-
-
-if __name__ == "__main__":
-    asyncio.run(test_debug_messages())
\ No newline at end of file
+
+    assert result.passed is scenario.passed
+    assert result.data["packages_found"] == scenario.found
+    if scenario.warning:
+        assert scenario.warning in result.warnings
+
+
+async def test_debug_disabled_is_silent(context, mocked_registries, capsys):
+    """Test no debug output is written while debug mode is off."""
+    set_debug_enabled(False)
+    validator = RegistryValidator({
+        "enabled": True,
+        "packages": [{"name": "fake-package-silent", "type": "npm"}],
+        "registries": mocked_registries,
+    })
+
+    await validator.validate(context)
+
+    assert "[REGISTRY-" not in capsys.readouterr().err
+
+
+async def test_debug_disabled_skips_shared_logger(context, mocked_registries):
+    """Test the registry wrapper returns before reaching the shared logger."""
+    set_debug_enabled(False)
+    validator = RegistryValidator({
+        "enabled": True,
+        "packages": [{"name": "fake-package-skip", "type": "npm"}],
+        "registries": mocked_registries,
+    })
+
+    with patch.object(registry, "_debug_log") as shared_logger:
+        await validator.validate(context)
+
+    shared_logger.assert_not_called()
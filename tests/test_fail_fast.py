@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 """Test fail-fast behavior with registry validation first."""
 
-import asyncio
-import tempfile
-import json
-import os
+import pytest
+
 from mcp_validation.core.validator import MCPValidationOrchestrator
 from mcp_validation.config.settings import ConfigurationManager
 
+# Talks to live package registries; the progress output is written in one go
+pytestmark = [pytest.mark.network, pytest.mark.usefixtures("buffered_stdout")]
+
 
 async def test_fail_fast_validation():
     """Test fail-fast validation with registry checks first."""
@@ -106,84 +107,72 @@ async def test_fail_fast_validation():
 async def run_validation_test(config_data, profile_name):
     """Run a validation test with the given configuration."""
     
-    # Write config to temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(config_data, f, indent=2)
-        config_file = f.name
+    # Load configuration
+    config_manager = ConfigurationManager.from_dict(config_data)
+    config_manager.set_active_profile(profile_name)
+
+    orchestrator = MCPValidationOrchestrator(config_manager)
+    profile = config_manager.get_active_profile()
+
+    print(f"Profile: {profile.name}")
+    print(f"Continue on failure: {profile.continue_on_failure}")
     
-    try:
-        # Load configuration
-        config_manager = ConfigurationManager(config_file)
-        config_manager.set_active_profile(profile_name)
-        
-        orchestrator = MCPValidationOrchestrator(config_manager)
-        profile = config_manager.get_active_profile()
-        
-        print(f"Profile: {profile.name}")
-        print(f"Continue on failure: {profile.continue_on_failure}")
-        
-        # Create validators in order
-        validators = []
-        for validator_name, validator_config in profile.validators.items():
-            if validator_config.enabled:
-                validator = orchestrator.registry.create_validator(
-                    validator_name,
-                    {
-                        'enabled': validator_config.enabled,
-                        'required': validator_config.required,
-                        **validator_config.parameters
-                    }
-                )
-                if validator:
-                    validators.append(validator)
-        
-        # Simulate sequential execution with fail-fast
-        from mcp_validation.validators.base import ValidationContext
-        context = ValidationContext(
-            process=None,
-            server_info={},
-            capabilities={},
-            timeout=30.0
-        )
-        
-        print(f"\nExecuting {len(validators)} validators:")
+    # Create validators in order
+    validators = []
+    for validator_name, validator_config in profile.validators.items():
+        if validator_config.enabled:
+            validator = orchestrator.registry.create_validator(
+                validator_name,
+                {
+                    'enabled': validator_config.enabled,
+                    'required': validator_config.required,
+                    **validator_config.parameters
+                }
+            )
+            if validator:
+                validators.append(validator)
+    
+    # Simulate sequential execution with fail-fast
+    from mcp_validation.validators.base import ValidationContext
+    context = ValidationContext(
+        process=None,
+        server_info={},
+        capabilities={},
+        timeout=30.0,
+        fail_fast=not profile.continue_on_failure,
+    )
+    
+    print(f"\nExecuting {len(validators)} validators:")
+    
+    overall_success = True
+    for i, validator in enumerate(validators, 1):
+        print(f"\n  {i}. Running {validator.name.upper()} validator...")
         
-        overall_success = True
-        for i, validator in enumerate(validators, 1):
-            print(f"\n  {i}. Running {validator.name.upper()} validator...")
+        if validator.name == "registry":
+            # Actually run registry validation
+            result = await validator.validate(context)
             
-            if validator.name == "registry":
-                # Actually run registry validation
-                result = await validator.validate(context)
-                
-                print(f"     Result: {'✅ PASS' if result.passed else '❌ FAIL'}")
-                print(f"     Packages: {result.data['packages_found']}/{result.data['total_packages']} found")
-                print(f"     Time: {result.execution_time:.2f}s")
-                
-                if result.errors:
-                    print("     Errors:")
-                    for error in result.errors[:2]:  # Show first 2 errors
-                        print(f"       • {error}")
-                    if len(result.errors) > 2:
-                        print(f"       ... and {len(result.errors) - 2} more")
+            print(f"     Result: {'✅ PASS' if result.passed else '❌ FAIL'}")
+            print(f"     Packages: {result.data['packages_found']}/{result.data['total_packages']} found")
+            print(f"     Time: {result.execution_time:.2f}s")
+            
+            if result.errors:
+                print("     Errors:")
+                for error in result.errors[:2]:  # Show first 2 errors
+                    print(f"       • {error}")
+                if len(result.errors) > 2:
+                    print(f"       ... and {len(result.errors) - 2} more")
+            
+            if not result.passed and profile.validators[validator.name].required:
+                print(f"     🛑 STOPPING: Required validator failed")
+                overall_success = False
+                break
                 
-                if not result.passed and profile.validators[validator.name].required:
-                    print(f"     🛑 STOPPING: Required validator failed")
-                    overall_success = False
-                    break
-                    
-            else:
-                # Simulate other validators
-                print(f"     Result: ⏭️  SKIPPED (no MCP server process)")
-        
-        if overall_success:
-            print(f"\n✅ Validation would continue to completion")
         else:
-            print(f"\n❌ Validation stopped early due to dependency failures")
-            
-    finally:
-        os.unlink(config_file)
-
-
-if __name__ == "__main__":
-    asyncio.run(test_fail_fast_validation())
\ No newline at end of file
+            # Simulate other validators
+            print(f"     Result: ⏭️  SKIPPED (no MCP server process)")
+    
+    if overall_success:
+        print(f"\n✅ Validation would continue to completion")
+    else:
+        print(f"\n❌ Validation stopped early due to dependency failures")
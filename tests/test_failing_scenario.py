@@ -1,21 +1,21 @@
 #!/usr/bin/env python3
 """Test a specific failing scenario with debug output."""
 
-import asyncio
-import os
+import pytest
+
 from mcp_validation.validators.registry import RegistryValidator
 from mcp_validation.validators.base import ValidationContext
 
+# Talks to live package registries; the progress output is written in one go
+pytestmark = [pytest.mark.network, pytest.mark.usefixtures("buffered_stdout")]
+
 
-async def test_failing_scenario():
+async def test_failing_scenario(debug_enabled):
     """Test a specific scenario that should fail with detailed debug output."""
     
     print("🐛 Registry Validator Failing Scenario Analysis\n")
     print("=" * 70)
     
-    # Enable debug mode
-    os.environ['MCP_REGISTRY_DEBUG'] = '1'
-    
     print("Testing scenario that demonstrates why registry validation fails:")
     print("- Multiple non-existent packages")
     print("- Version mismatches") 
@@ -106,7 +106,3 @@ async def test_failing_scenario():
         print(f"  1. Using existing version numbers")
         print(f"  2. Removing version constraints (allow any version)")
         print(f"  3. Updating to newer versions that exist")
-
-
-if __name__ == "__main__":
-    asyncio.run(test_failing_scenario())
\ No newline at end of file
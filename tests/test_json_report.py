@@ -0,0 +1,144 @@
+"""Tests for JSON report generation."""
+
+import json
+
+import pytest
+
+from mcp_validation.core.result import ValidationSession, ValidatorResult
+from mcp_validation.reporting.json_report import JSONReporter
+from mcp_validation.utils import fastjson
+
+
+@pytest.fixture
+def session():
+    """Create a validation session with a few validator results."""
+    return ValidationSession(
+        profile_name="comprehensive",
+        overall_success=False,
+        execution_time=1.5,
+        validator_results=[
+            ValidatorResult(
+                validator_name="protocol",
+                passed=True,
+                errors=[],
+                warnings=[],
+                data={
+                    "server_info": {"name": "test-server", "version": "1.0"},
+                    "capabilities": {"tools": {}},
+                },
+                execution_time=0.2,
+            ),
+            ValidatorResult(
+                validator_name="capabilities",
+                passed=False,
+                errors=["tools/list failed"],
+                warnings=["no prompts"],
+                data={"tools": ["echo", "add"], "prompts": [], "resources": []},
+                execution_time=0.3,
+            ),
+            ValidatorResult(
+                validator_name="ping",
+                passed=True,
+                errors=[],
+                warnings=[],
+                data={"supported": True, "response_time_ms": 1.25, "error": None},
+                execution_time=0.1,
+            ),
+        ],
+        errors=["tools/list failed"],
+        warnings=["no prompts"],
+        command_args=["python", "server.py"],
+    )
+
+
+class TestJSONReporter:
+    """Test cases for JSONReporter."""
+
+    def test_generate_report_summary(self, session):
+        """Test summary counts and aggregated server information."""
+        report = JSONReporter().generate_report(session, ["python", "server.py"])
+
+        summary = report["validation_summary"]
+        assert summary["validators_run"] == 3
+        assert summary["validators_passed"] == 2
+        assert summary["total_errors"] == 1
+        assert summary["total_warnings"] == 1
+
+        server = report["server_information"]
+        assert server["server_info"]["name"] == "test-server"
+        assert server["discovered_items"]["tools"] == {"count": 2, "names": ["echo", "add"]}
+        assert report["report_metadata"]["command"] == "python server.py"
+        assert report["report_metadata"]["generated_at"].endswith("+00:00")
+
+    def test_generate_report_validator_results(self, session):
+        """Test per-validator entries and optional feature extraction."""
+        report = JSONReporter().generate_report(session, ["python", "server.py"])
+
+        capabilities = report["validator_results"][1]
+        assert capabilities["validator_name"] == "capabilities"
+        assert capabilities["error_count"] == 1
+        assert capabilities["warning_count"] == 1
+
+        ping = report["optional_features"]["ping_protocol"]
+        assert ping == {"tested": True, "supported": True, "response_time_ms": 1.25, "error": None}
+        assert report["optional_features"]["error_compliance"]["tested"] is False
+        assert report["optional_features"]["error_compliance"]["compliance_issues"] == []
+        assert report["repository_validation"]["repo_availability"]["executed"] is False
+        assert report["runtime_validation"]["runtime_executable"]["test_execution_time"] == 0
+
+    def test_generate_report_empty_session(self):
+        """Test a session without validator results yields the minimal report."""
+        session = ValidationSession(
+            profile_name="comprehensive",
+            overall_success=False,
+            execution_time=0.1,
+            validator_results=[],
+            errors=["Failed to start server"],
+            warnings=[],
+        )
+
+        report = JSONReporter().generate_report(session, ["python", "server.py"])
+
+        assert set(report) == {
+            "report_metadata",
+            "validation_summary",
+            "validator_results",
+            "issues",
+        }
+        assert report["validation_summary"]["validators_run"] == 0
+        assert report["validation_summary"]["total_errors"] == 1
+        assert report["issues"]["errors"] == ["Failed to start server"]
+
+    def test_save_report_round_trip(self, session, tmp_path):
+        """Test the saved file is valid JSON matching the generated report."""
+        filename = tmp_path / "report.json"
+        reporter = JSONReporter()
+
+        reporter.save_report(session, str(filename), ["python", "server.py"])
+
+        saved = json.loads(filename.read_text())
+        assert saved["validation_summary"]["validators_run"] == 3
+        assert saved["validator_results"][0]["data"]["server_info"]["name"] == "test-server"
+
+
+class TestFastJSON:
+    """Test cases for the JSON helpers."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dumps_loads_round_trip(self, monkeypatch, use_orjson):
+        """Test both the orjson and stdlib paths produce equivalent JSON."""
+        if not use_orjson:
+            monkeypatch.setattr(fastjson, "orjson", None)
+        elif fastjson.orjson is None:
+            pytest.skip("orjson not installed")
+
+        payload = {"name": "lodash", "versions": ["4.17.21"], 1: True}
+        encoded = fastjson.dumps(payload, indent=True)
+
+        assert isinstance(encoded, bytes)
+        assert fastjson.loads(encoded) == {"name": "lodash", "versions": ["4.17.21"], "1": True}
+
+    def test_loads_invalid_raises_json_decode_error(self):
+        """Test invalid input raises the stdlib JSONDecodeError type."""
+        with pytest.raises(json.JSONDecodeError):
+            fastjson.loads(b"{not json")
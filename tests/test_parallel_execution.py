@@ -0,0 +1,182 @@
+"""Tests for running independent validators concurrently."""
+
+import asyncio
+
+from mcp_validation.config.settings import ConfigurationManager, ValidationProfile
+from mcp_validation.core.validator import MCPValidationOrchestrator
+from mcp_validation.validators.base import BaseValidator, ValidationContext, ValidatorResult
+
+
+class StepValidator(BaseValidator):
+    """Validator that records when it runs and optionally waits on an event."""
+
+    def __init__(self, name, log, depends_on=(), wait_for=None, passed=True, required=False):
+        super().__init__({"required": required})
+        self._name = name
+        self._log = log
+        self._depends_on = list(depends_on)
+        self._wait_for = wait_for
+        self._passed = passed
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return "Step validator for tests"
+
+    @property
+    def dependencies(self):
+        return self._depends_on
+
+    async def validate(self, context: ValidationContext) -> ValidatorResult:
+        self._log.append(self._name)
+        if self._wait_for is not None:
+            await asyncio.wait_for(self._wait_for.wait(), 5.0)
+        return ValidatorResult(
+            validator_name=self._name,
+            passed=self._passed,
+            errors=[] if self._passed else [f"{self._name} failed"],
+            warnings=[],
+            data={},
+            execution_time=0.0,
+        )
+
+
+class SignalValidator(StepValidator):
+    """Validator that sets an event other validators wait on."""
+
+    def __init__(self, name, log, event, **kwargs):
+        super().__init__(name, log, **kwargs)
+        self._event = event
+
+    async def validate(self, context: ValidationContext) -> ValidatorResult:
+        self._event.set()
+        return await super().validate(context)
+
+
+def _context():
+    return ValidationContext(process=None, server_info={}, capabilities={}, timeout=5.0)
+
+
+async def test_independent_chains_run_concurrently():
+    """Test a chain blocked on another chain's progress completes (it would deadlock in order)."""
+    log = []
+    registry_done = asyncio.Event()
+    validators = [
+        StepValidator("protocol", log),
+        StepValidator("capabilities", log, depends_on=["protocol"], wait_for=registry_done),
+        SignalValidator("registry", log, registry_done),
+    ]
+    profile = ValidationProfile(name="parallel", description="", parallel_execution=True)
+
+    results = await MCPValidationOrchestrator(ConfigurationManager())._execute_validators_parallel(
+        validators, _context(), profile
+    )
+
+    assert [result.validator_name for result in results] == ["protocol", "capabilities", "registry"]
+    assert log.index("protocol") < log.index("capabilities")
+
+
+async def test_required_failure_cancels_other_chains_with_fail_fast():
+    """Test a required failure stops validators still running in other chains."""
+    log = []
+    never = asyncio.Event()
+    validators = [
+        StepValidator("protocol", log, wait_for=never),
+        StepValidator("registry", log, passed=False, required=True),
+    ]
+    profile = ValidationProfile(
+        name="parallel", description="", parallel_execution=True, continue_on_failure=False
+    )
+
+    results = await MCPValidationOrchestrator(ConfigurationManager())._execute_validators_parallel(
+        validators, _context(), profile
+    )
+
+    assert [result.validator_name for result in results] == ["registry"]
+    assert not results[0].passed
+
+
+async def test_cancelled_chain_keeps_finished_results():
+    """Test fail-fast cancellation keeps results a chain produced before it was cancelled."""
+    log = []
+    never = asyncio.Event()
+    protocol_done = asyncio.Event()
+    validators = [
+        SignalValidator("protocol", log, protocol_done),
+        StepValidator("capabilities", log, depends_on=["protocol"], wait_for=never),
+        StepValidator("registry", log, wait_for=protocol_done, passed=False, required=True),
+    ]
+    profile = ValidationProfile(
+        name="parallel", description="", parallel_execution=True, continue_on_failure=False
+    )
+
+    results = await MCPValidationOrchestrator(ConfigurationManager())._execute_validators_parallel(
+        validators, _context(), profile
+    )
+
+    assert [result.validator_name for result in results] == ["protocol", "registry"]
+
+
+async def test_chain_exception_reported_without_stopping_other_chains():
+    """Test an exception escaping one chain becomes a failed result for that validator."""
+
+    class BrokenValidator(StepValidator):
+        def is_applicable(self, context):
+            raise RuntimeError("boom")
+
+    log = []
+    validators = [BrokenValidator("protocol", log), StepValidator("registry", log)]
+    profile = ValidationProfile(name="parallel", description="", parallel_execution=True)
+
+    results = await MCPValidationOrchestrator(ConfigurationManager())._execute_validators_parallel(
+        validators, _context(), profile
+    )
+
+    assert [(result.validator_name, result.passed) for result in results] == [
+        ("protocol", False),
+        ("registry", True),
+    ]
+    assert results[0].errors == ["Validator execution failed: boom"]
+
+
+def test_validators_grouped_into_dependency_chains():
+    """Test validators sharing a dependency root end up in one ordered chain."""
+    log = []
+    validators = [
+        StepValidator("repo_availability", log),
+        StepValidator("runtime_exists", log),
+        StepValidator("protocol", log),
+        StepValidator("license", log, depends_on=["repo_availability"]),
+        StepValidator("ping", log, depends_on=["protocol"]),
+        StepValidator("container_ubi", log, depends_on=["runtime_exists"]),
+        StepValidator("errors", log, depends_on=["protocol"]),
+    ]
+
+    chains = MCPValidationOrchestrator._group_validators_by_dependencies(validators)
+
+    assert [[v.name for v in chain] for chain in chains] == [
+        ["repo_availability", "license"],
+        ["runtime_exists", "container_ubi"],
+        ["protocol", "ping", "errors"],
+    ]
+
+
+def test_transport_validators_share_a_chain_without_protocol():
+    """Test validators depending on a disabled protocol validator still run in one chain."""
+    log = []
+    validators = [
+        StepValidator("capabilities", log, depends_on=["protocol"]),
+        StepValidator("registry", log),
+        StepValidator("ping", log, depends_on=["protocol"]),
+        StepValidator("errors", log, depends_on=["protocol"]),
+    ]
+
+    chains = MCPValidationOrchestrator._group_validators_by_dependencies(validators)
+
+    assert [[v.name for v in chain] for chain in chains] == [
+        ["capabilities", "ping", "errors"],
+        ["registry"],
+    ]
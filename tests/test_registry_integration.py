@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """Test registry validator integration with MCP validation framework."""
 
-import asyncio
+import pytest
+
 from mcp_validation.core.validator import MCPValidationOrchestrator
 from mcp_validation.config.settings import ConfigurationManager, ValidationProfile, ValidatorConfig
 
+# Talks to live package registries; the progress output is written in one go
+pytestmark = [pytest.mark.network, pytest.mark.usefixtures("buffered_stdout")]
+
 
 async def test_registry_integration():
     """Test that registry validator is properly integrated."""
@@ -94,7 +98,3 @@ async def test_registry_integration():
         print(f"  {status} {name} ({registry_url})")
         if pkg_result.get('error'):
             print(f"    Error: {pkg_result['error']}")
-
-
-if __name__ == "__main__":
-    asyncio.run(test_registry_integration())
\ No newline at end of file
@@ -0,0 +1,605 @@
+"""Offline tests for RegistryValidator."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from mcp_validation.utils import fastjson
+from mcp_validation.validators.base import ValidationContext
+from mcp_validation.validators import registry
+from mcp_validation.validators.registry import DockerRegistryChecker, PackageInfo, RegistryValidator
+
+
+@pytest.fixture(autouse=True)
+def clear_check_cache():
+    """Keep cached registry lookups from leaking between tests."""
+    RegistryValidator.clear_check_cache()
+    yield
+    RegistryValidator.clear_check_cache()
+
+
+@pytest.fixture
+def context():
+    """Create a validation context without a server process."""
+    return ValidationContext(process=None, server_info={}, capabilities={}, timeout=30.0)
+
+
+async def test_injected_session_is_reused(context):
+    """Test a caller-provided session is passed to checkers instead of a new one."""
+    session = object()
+    validator = RegistryValidator(
+        {"enabled": True, "packages": [{"name": "lodash", "type": "npm"}]}, session=session
+    )
+    check = AsyncMock(return_value=({"exists": True, "name": "lodash"}, frozenset()))
+
+    with patch("mcp_validation.validators.registry.aiohttp.ClientSession") as mock_session:
+        with patch.object(validator.checkers["npm"], "fetch_package", check):
+            result = await validator.validate(context)
+
+    assert result.passed
+    assert check.call_args.args[1] is session
+    mock_session.assert_not_called()
+
+
+async def test_context_session_used_without_injected_session():
+    """Test the run-wide session from the context is used when none was injected."""
+    session = object()
+    context = ValidationContext(
+        process=None, server_info={}, capabilities={}, timeout=30.0, http_session=session
+    )
+    validator = RegistryValidator({"enabled": True, "packages": [{"name": "lodash"}]})
+    check = AsyncMock(return_value=({"exists": True, "name": "lodash"}, frozenset()))
+
+    with patch.object(validator.checkers["npm"], "fetch_package", check):
+        await validator.validate(context)
+
+    assert check.call_args.args[1] is session
+
+
+async def test_registry_uses_gather(context):
+    """Test package checks overlap instead of running one after another."""
+    windows = []
+
+    async def slow_check(name, session):
+        start = time.perf_counter()
+        await asyncio.sleep(0.05)
+        windows.append((start, time.perf_counter()))
+        return {"exists": True, "name": name}, frozenset()
+
+    packages = [{"name": f"pkg-{i}", "type": "npm"} for i in range(4)]
+    validator = RegistryValidator({"enabled": True, "packages": packages}, session=object())
+
+    with patch.object(validator.checkers["npm"], "fetch_package", slow_check):
+        result = await validator.validate(context)
+
+    assert result.data["packages_found"] == 4
+    assert [r["name"] for r in result.data["packages_checked"]] == [p["name"] for p in packages]
+    assert max(start for start, _ in windows) < min(end for _, end in windows)
+
+
+async def test_unsupported_registry_keeps_package_order(context):
+    """Test unsupported types are reported without disturbing the other results."""
+    packages = [
+        {"name": "lodash", "type": "npm"},
+        {"name": "gem-thing", "type": "rubygems"},
+        {"name": "express", "type": "npm"},
+    ]
+    validator = RegistryValidator({"enabled": True, "packages": packages}, session=object())
+    check = AsyncMock(
+        side_effect=lambda name, session: ({"exists": True, "name": name}, frozenset())
+    )
+
+    with patch.object(validator.checkers["npm"], "fetch_package", check):
+        result = await validator.validate(context)
+
+    assert [r["name"] for r in result.data["packages_checked"]] == ["lodash", "express"]
+    assert result.data["registry_errors"] == 1
+    assert result.errors == ["Unsupported registry type: rubygems for package gem-thing"]
+
+
+async def test_lookups_cached_across_validators(context):
+    """Test found and missing packages are looked up once per process."""
+    packages = [{"name": "lodash", "type": "npm"}, {"name": "no-such-pkg", "type": "npm"}]
+    check = AsyncMock(
+        side_effect=lambda name, session: (
+            {"exists": True, "name": name}
+            if name == "lodash"
+            else {"exists": False, "name": name, "error": "Package not found"},
+            frozenset(),
+        )
+    )
+
+    for _ in range(3):
+        validator = RegistryValidator({"enabled": True, "packages": packages}, session=object())
+        with patch.object(validator.checkers["npm"], "fetch_package", check):
+            result = await validator.validate(context)
+        assert result.data["packages_found"] == 1
+        assert result.data["packages_missing"] == 1
+
+    assert check.call_count == 2
+
+
+async def test_cache_evicts_least_recently_used(monkeypatch):
+    """Test the lookup cache stays bounded and keeps recently used entries."""
+    monkeypatch.setattr(RegistryValidator, "_check_cache_maxsize", 2)
+    check = AsyncMock(side_effect=lambda name, session: ({"exists": True}, frozenset()))
+
+    async def validate(name):
+        # A separate run each time, so the per-run fetch cache starts empty
+        context = ValidationContext(process=None, server_info={}, capabilities={})
+        validator = RegistryValidator({"enabled": True, "packages": [name]}, session=object())
+        with patch.object(validator.checkers["npm"], "fetch_package", check):
+            await validator.validate(context)
+
+    for name in ("a", "b", "a", "c", "a", "b"):
+        await validate(name)
+
+    # "b" was evicted by "c" because "a" had just been used; "a" stayed cached
+    assert [call.args[0] for call in check.call_args_list] == ["a", "b", "c", "b"]
+    assert len(RegistryValidator._check_cache) == 2
+
+
+async def test_transient_errors_not_cached(context):
+    """Test timeouts are retried on the next validation."""
+    packages = [{"name": "lodash", "type": "npm"}]
+    check = AsyncMock(
+        return_value=(
+            {"exists": False, "name": "lodash", "error": "Registry request timeout"},
+            frozenset(),
+        )
+    )
+
+    for _ in range(2):
+        validator = RegistryValidator({"enabled": True, "packages": packages}, session=object())
+        with patch.object(validator.checkers["npm"], "fetch_package", check):
+            await validator.validate(context)
+
+    assert check.call_count == 2
+
+
+async def test_concurrent_duplicate_lookups_coalesced(context):
+    """Test identical packages checked at the same time share one request."""
+    calls = []
+
+    async def slow_check(name, session):
+        calls.append(name)
+        await asyncio.sleep(0.01)
+        return {"exists": True, "name": name}, frozenset()
+
+    packages = [{"name": "lodash", "type": "npm"}] * 3
+    validator = RegistryValidator({"enabled": True, "packages": packages}, session=object())
+
+    with patch.object(validator.checkers["npm"], "fetch_package", slow_check):
+        result = await validator.validate(context)
+
+    assert calls == ["lodash"]
+    assert result.data["packages_found"] == 3
+
+
+async def test_cancelled_owner_does_not_cancel_shared_lookup():
+    """Test cancelling the caller that started a lookup leaves it running for other waiters."""
+    release = asyncio.Event()
+    validator = RegistryValidator({"enabled": True}, session=object())
+    key = ("GET", "npm", "https://registry.npmjs.org", "lodash", None)
+
+    async def lookup():
+        await release.wait()
+        return {"exists": True, "name": "lodash"}, frozenset()
+
+    semaphore = asyncio.Semaphore(1)
+    owner = asyncio.ensure_future(validator._cached_lookup(key, lookup, semaphore, {}))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(validator._cached_lookup(key, lookup, semaphore, {}))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    result, _ = await waiter
+    assert owner.cancelled()
+    assert result["exists"]
+    assert key not in RegistryValidator._in_flight
+    assert key in RegistryValidator._check_cache
+
+
+async def test_lookup_cancelled_once_every_caller_is_gone():
+    """Test a shared lookup stops when its last waiting caller is cancelled."""
+    started = asyncio.Event()
+    validator = RegistryValidator({"enabled": True}, session=object())
+    key = ("GET", "npm", "https://registry.npmjs.org", "lodash", None)
+
+    async def lookup():
+        started.set()
+        await asyncio.Event().wait()
+
+    owner = asyncio.ensure_future(
+        validator._cached_lookup(key, lookup, asyncio.Semaphore(1), {})
+    )
+    await started.wait()
+    task = RegistryValidator._in_flight[key]
+
+    owner.cancel()
+    await asyncio.gather(owner, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert task.cancelled()
+    assert key not in RegistryValidator._in_flight
+
+
+async def test_concurrency_bounded(context):
+    """Test no more than max_concurrency registry requests run at once."""
+    active = peak = 0
+
+    async def slow_check(name, session):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"exists": True, "name": name}, frozenset()
+
+    packages = [{"name": f"pkg-{i}", "type": "npm"} for i in range(6)]
+    validator = RegistryValidator(
+        {"enabled": True, "packages": packages, "max_concurrency": 2}, session=object()
+    )
+
+    with patch.object(validator.checkers["npm"], "fetch_package", slow_check):
+        result = await validator.validate(context)
+
+    assert result.data["packages_found"] == 6
+    assert peak == 2
+
+
+async def test_check_timeout_reported_as_warning():
+    """Test a check that outlives the context timeout becomes a warning."""
+    async def hung_check(name, session):
+        await asyncio.sleep(10)
+
+    context = ValidationContext(process=None, server_info={}, capabilities={}, timeout=0.05)
+    validator = RegistryValidator(
+        {"enabled": True, "packages": [{"name": "lodash", "type": "npm"}]}, session=object()
+    )
+
+    with patch.object(validator.checkers["npm"], "fetch_package", hung_check):
+        result = await validator.validate(context)
+
+    assert result.passed
+    assert result.warnings == ["Could not verify package lodash: Registry request timeout"]
+    assert result.data["registry_errors"] == 1
+
+
+async def test_queued_checks_share_the_context_timeout():
+    """Test the whole batch is bounded by the context timeout, queueing included."""
+    async def hung_check(name, session):
+        await asyncio.sleep(10)
+
+    context = ValidationContext(process=None, server_info={}, capabilities={}, timeout=0.1)
+    packages = [{"name": f"pkg-{i}", "type": "npm"} for i in range(4)]
+    validator = RegistryValidator(
+        {"enabled": True, "packages": packages, "max_concurrency": 1}, session=object()
+    )
+
+    start = time.monotonic()
+    with patch.object(validator.checkers["npm"], "fetch_package", hung_check):
+        result = await validator.validate(context)
+
+    assert time.monotonic() - start < 0.3  # Not 4 x timeout behind the semaphore
+    assert result.data["registry_errors"] == 4
+
+
+async def test_shared_session_reused_until_closed(context):
+    """Test validators without a session share one keep-alive session."""
+    sessions = []
+
+    async def record_session(name, session):
+        sessions.append(session)
+        return {"exists": True, "name": name}, frozenset()
+
+    for name in ("lodash", "express"):
+        validator = RegistryValidator({"enabled": True, "packages": [{"name": name}]})
+        with patch.object(validator.checkers["npm"], "fetch_package", record_session):
+            await validator.validate(context)
+
+    assert sessions[0] is sessions[1]
+    assert sessions[0].connector.limit_per_host == 8
+
+    await registry.close_shared_session()
+    assert sessions[0].closed
+    assert registry._get_shared_session() is not sessions[0]
+
+
+async def test_versions_answered_from_one_document(context):
+    """Test several versions of one npm package need a single registry fetch."""
+    fetch = AsyncMock(
+        return_value=({"exists": True, "name": "lodash"}, frozenset({"4.17.20", "4.17.21"}))
+    )
+    packages = [
+        {"name": "lodash", "type": "npm"},
+        {"name": "lodash", "type": "npm", "version": "4.17.21"},
+        {"name": "lodash", "type": "npm", "version": "999.888.777"},
+    ]
+    validator = RegistryValidator({"enabled": True, "packages": packages}, session=object())
+
+    with patch.object(validator.checkers["npm"], "fetch_package", fetch):
+        result = await validator.validate(context)
+
+    fetch.assert_awaited_once()
+    checked = result.data["packages_checked"]
+    assert "requested_version_exists" not in checked[0]
+    assert checked[1]["requested_version_exists"] is True
+    assert checked[2]["requested_version_exists"] is False
+    assert result.warnings == ["Package lodash exists but version/tag 999.888.777 not found"]
+
+
+@pytest.mark.parametrize(
+    "requested,exists", [("2.31.0", True), ("2.31", True), ("2.31.0.0", True), ("2.32", False)]
+)
+def test_pypi_versions_compared_in_canonical_form(requested, exists):
+    """Test PyPI versions match regardless of trailing zero release segments."""
+    pytest.importorskip("packaging")
+    versions = registry._pypi_version_set({"2.30.0": [], "2.31.0": []})
+    package = PackageInfo(name="requests", version=requested, registry_type="pypi")
+
+    result = registry._apply_requested_version({"exists": True}, versions, package, "PyPI")
+
+    assert result["requested_version_exists"] is exists
+
+
+@pytest.mark.parametrize(
+    "spec,expected",
+    [
+        ("express", ("express", None, "npm")),
+        ("@angular/core", ("@angular/core", None, "npm")),
+        ("@angular/core@17.0.0", ("@angular/core", "17.0.0", "npm")),
+        ("pypi:requests@2.31.0", ("requests", "2.31.0", "pypi")),
+        ("some_package.py", ("some_package.py", None, "pypi")),
+        ("docker:nginx@latest", ("nginx", "latest", "docker")),
+        ("fake/image", ("fake/image", None, "docker")),
+    ],
+)
+def test_string_package_specs_parsed(spec, expected):
+    """Test string specs infer the registry, and repeats reuse the cached parse."""
+    first = RegistryValidator({"packages": [spec]}).packages[0]
+    hits = registry._parse_package_spec.cache_info().hits
+    second = RegistryValidator({"packages": [spec]}).packages[0]
+
+    assert (first.name, first.version, first.registry_type) == expected
+    assert registry._parse_package_spec.cache_info().hits == hits + 1
+    assert second == first and second is not first
+
+
+@pytest.mark.parametrize(
+    "version,tag_exists,listed",
+    [("3.18", True, None), ("no-such-tag", False, None), (None, None, ["latest", "3.20"])],
+)
+async def test_docker_repository_and_tags_fetched_together(version, tag_exists, listed):
+    """Test the repository and tag requests overlap, and a requested tag is looked up directly."""
+    in_flight = peak = 0
+    paths = []
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        paths.append(request.path)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        if request.path.endswith("/tags"):
+            return web.json_response({"results": [{"name": "latest"}, {"name": "3.20"}]})
+        if "/tags/" in request.path:
+            if request.path.endswith("/3.18"):
+                return web.json_response({"name": "3.18"})
+            return web.json_response({"message": "tag not found"}, status=404)
+        return web.json_response({"description": "Alpine", "is_official": True})
+
+    app = web.Application()
+    app.router.add_get("/{path:.+}", handler)
+    checker = DockerRegistryChecker()
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        checker.hub_url = str(server.make_url("")).rstrip("/")
+        result = await checker.check_package(
+            PackageInfo(name="alpine", version=version, registry_type="docker"), session
+        )
+
+    assert peak == 2
+    assert result["exists"] and result["is_official"]
+    assert result.get("requested_tag_exists") is tag_exists
+    assert result.get("available_tags") == listed
+    if version:
+        assert f"/v2/repositories/library/alpine/tags/{version}" in paths
+
+
+async def test_registry_bodies_parsed_from_bytes(context, mocked_registries, monkeypatch):
+    """Test registry responses go to the JSON parser as raw bytes."""
+    seen = []
+    real_loads = fastjson.loads
+    monkeypatch.setattr(fastjson, "loads", lambda data: seen.append(data) or real_loads(data))
+    validator = RegistryValidator(
+        {
+            "packages": [{"name": "lodash", "type": "npm"}, {"name": "requests", "type": "pypi"}],
+            "registries": mocked_registries,
+        }
+    )
+
+    result = await validator.validate(context)
+
+    assert result.data["packages_found"] == 2
+    assert len(seen) == 2
+    assert all(isinstance(body, bytes) for body in seen)
+
+
+async def test_fail_fast_cancels_remaining_checks():
+    """Test a missing package cancels slower checks when the profile fails fast."""
+    finished = []
+
+    async def check(name, session):
+        if name == "missing-pkg":
+            return {"exists": False, "name": name, "error": "Package not found"}, frozenset()
+        await asyncio.sleep(5)
+        finished.append(name)
+        return {"exists": True, "name": name}, frozenset()
+
+    context = ValidationContext(
+        process=None, server_info={}, capabilities={}, timeout=30.0, fail_fast=True
+    )
+    packages = [{"name": "slow-a"}, {"name": "missing-pkg"}, {"name": "slow-b"}]
+    validator = RegistryValidator({"enabled": True, "packages": packages}, session=object())
+
+    start = time.perf_counter()
+    with patch.object(validator.checkers["npm"], "fetch_package", check):
+        result = await validator.validate(context)
+
+    assert time.perf_counter() - start < 1
+    assert finished == []
+    assert not result.passed
+    assert result.errors == ["Package missing-pkg not found in npm registry"]
+    assert [r["name"] for r in result.data["packages_checked"]] == ["missing-pkg"]
+    assert result.warnings == [
+        "Skipped 2 remaining package checks after a missing package (fail-fast)"
+    ]
+
+
+async def test_duplicate_packages_checked_once(context):
+    """Test repeated package entries share one check but are each reported."""
+    check = AsyncMock(
+        side_effect=lambda package, session: {"exists": True, "name": package.name}
+    )
+    packages = [
+        {"name": "alpine", "type": "docker"},
+        {"name": "alpine", "type": "docker"},
+        {"name": "alpine", "type": "docker", "version": "latest"},
+    ]
+    validator = RegistryValidator({"enabled": True, "packages": packages}, session=object())
+
+    with patch.object(RegistryValidator, "_cached_check", wraps=validator._cached_check) as spy:
+        with patch.object(validator.checkers["docker"], "check_package", check):
+            result = await validator.validate(context)
+
+    assert spy.call_count == 2  # alpine and alpine:latest
+    assert result.data["packages_found"] == 3
+    assert len(result.data["packages_checked"]) == 3
+
+
+async def test_rate_limiter_allows_burst_then_paces():
+    """Test requests beyond the burst are spaced by the configured rate."""
+    limiter = registry._RateLimiter(rate=20.0, burst=2)
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+    elapsed = time.monotonic() - start
+
+    assert 0.09 <= elapsed < 0.5  # Two immediate, then two more 50ms apart
+
+
+async def test_existence_only_uses_head_for_unversioned_packages(context):
+    """Test existence_only uses HEAD, or the abbreviated packument for versioned packages."""
+    methods = []
+    accepts = []
+
+    async def handler(request):
+        methods.append((request.method, request.path))
+        if request.method == "GET":
+            accepts.append(request.headers.get("Accept"))
+        if request.match_info["name"] == "missing":
+            return web.json_response({"error": "Not found"}, status=404)
+        return web.json_response({"versions": {"1.0.0": {}}, "dist-tags": {"latest": "1.0.0"}})
+
+    app = web.Application()
+    app.router.add_get("/{name}", handler)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        validator = RegistryValidator(
+            {
+                "enabled": True,
+                "existence_only": True,
+                "packages": ["present", "missing", "pinned@1.0.0"],
+                "registries": {"npm_url": str(server.make_url(""))},
+            },
+            session=session,
+        )
+        result = await validator.validate(context)
+
+    assert sorted(methods) == [("GET", "/pinned"), ("HEAD", "/missing"), ("HEAD", "/present")]
+    assert accepts == ["application/vnd.npm.install-v1+json"]
+    assert [p["exists"] for p in result.data["packages_checked"]] == [True, False, True]
+    assert result.data["packages_checked"][2]["requested_version_exists"] is True
+    assert any("missing" in error for error in result.errors)
+
+
+async def test_unchanged_document_revalidated_from_disk(monkeypatch, tmp_path):
+    """Test a stored document is revalidated with its ETag and reused on 304."""
+    monkeypatch.setenv("MCP_VALIDATION_CACHE_DIR", str(tmp_path))
+    conditional = []
+
+    async def handler(request):
+        conditional.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response(
+            {"versions": {"1.0.0": {}}, "dist-tags": {"latest": "1.0.0"}},
+            headers={"ETag": '"v1"'},
+        )
+
+    app = web.Application()
+    app.router.add_get("/{name}", handler)
+    checker = registry.NPMRegistryChecker()
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        checker.registry_url = str(server.make_url("")).rstrip("/")
+        first = await checker.fetch_package("lodash", session)
+        second = await checker.fetch_package("lodash", session)
+
+    assert conditional == [None, '"v1"']
+    assert second == first
+    assert first[0]["latest_version"] == "1.0.0"
+
+
+async def test_offline_mode_answers_from_fixtures(context, monkeypatch):
+    """Test MCP_VALIDATION_TEST_OFFLINE answers checks without any HTTP request."""
+    monkeypatch.setenv("MCP_VALIDATION_TEST_OFFLINE", "1")
+    validator = RegistryValidator(
+        {
+            "packages": [
+                {"name": "lodash", "type": "npm", "version": "4.17.21"},
+                {"name": "requests", "type": "pypi", "version": "2.31"},
+                {"name": "alpine", "type": "docker", "version": "nonexistent-tag-12345"},
+                {"name": "nonexistent-package-12345", "type": "npm"},
+            ]
+        },
+        session=object(),  # Any request would fail on this
+    )
+
+    result = await validator.validate(context)
+
+    checked = result.data["packages_checked"]
+    assert [package["exists"] for package in checked] == [True, True, True, False]
+    assert checked[0]["requested_version_exists"]
+    assert checked[1]["requested_version_exists"]
+    assert not checked[2]["requested_tag_exists"]
+    assert checked[3]["error"] == "Package not found"
+    assert not result.passed
+
+
+async def test_fetch_cache_shared_within_a_run(context):
+    """Test validators sharing a context reuse its documents after the class cache expires."""
+    check = AsyncMock(return_value=({"exists": True, "name": "lodash"}, frozenset(["4.17.21"])))
+
+    for version in ("4.17.21", "1.0.0"):
+        RegistryValidator.clear_check_cache()
+        validator = RegistryValidator(
+            {"packages": [{"name": "lodash", "type": "npm", "version": version}]},
+            session=object(),
+        )
+        with patch.object(validator.checkers["npm"], "fetch_package", check):
+            result = await validator.validate(context)
+
+    check.assert_awaited_once()
+    assert "npm:lodash" in context.fetch_cache
+    assert result.warnings == ["Package lodash exists but version/tag 1.0.0 not found"]
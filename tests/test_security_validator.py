@@ -0,0 +1,196 @@
+"""Tests for the mcp-scan security validator."""
+
+import json
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_validation.validators.base import ValidationContext
+from mcp_validation.validators import security
+from mcp_validation.validators.security import SecurityValidator
+
+SCAN_RESULTS = {
+    "/tmp/config.json": {
+        "servers": [
+            {
+                "signature": {
+                    "tools": [{"name": "echo"}, {"name": "add"}],
+                    "vulnerabilities": [
+                        {"type": "prompt_injection", "severity": "high"},
+                        {"type": "tool_poisoning", "severity": "low"},
+                    ],
+                }
+            },
+            {
+                "signature": {
+                    "tools": [{"name": "read_file"}],
+                    "vulnerabilities": [{"type": "prompt_injection", "severity": "medium"}],
+                }
+            },
+        ]
+    }
+}
+
+
+@pytest.fixture
+def context():
+    """Create a validation context without a server process."""
+    return ValidationContext(process=None, server_info={}, capabilities={}, timeout=30.0)
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_cache():
+    """Ensure each test resolves tool paths from its own patched PATH."""
+    SecurityValidator.clear_tool_cache()
+    yield
+    SecurityValidator.clear_tool_cache()
+
+
+class TestSecurityValidator:
+    """Test cases for SecurityValidator."""
+
+    def test_tool_lookup_cached(self):
+        """Test PATH lookups happen once across repeated availability checks."""
+        with patch("mcp_validation.validators.security.shutil.which") as mock_which:
+            mock_which.side_effect = lambda name: "/usr/bin/uvx" if name == "uvx" else None
+            validator = SecurityValidator()
+
+            assert validator._check_mcp_scan_available()
+            assert validator._check_mcp_scan_available()
+
+        assert mock_which.call_count == 2  # mcp-scan and uvx, resolved once
+
+    def test_refresh_redetects_tools(self):
+        """Test refresh() picks up tools installed after the validator was created."""
+        with patch("mcp_validation.validators.security.shutil.which", return_value=None):
+            validator = SecurityValidator()
+        assert not validator._check_mcp_scan_available()
+
+        with patch("mcp_validation.validators.security.shutil.which", return_value="/bin/uvx"):
+            validator.refresh()
+        assert validator._check_mcp_scan_available()
+
+    def test_not_applicable_without_tools(self, context):
+        """Test validator is skipped when neither mcp-scan nor uvx is installed."""
+        with patch("mcp_validation.validators.security.shutil.which", return_value=None):
+            assert not SecurityValidator({"enabled": True}).is_applicable(context)
+
+    def test_scan_config_file_written_once(self):
+        """Test the mcp-scan config is written once and shared by later scans."""
+        try:
+            with patch("mcp_validation.validators.security.atexit.register") as mock_register:
+                first = security._scan_config_file()
+                mtime = os.stat(first).st_mtime_ns
+                second = security._scan_config_file()
+
+            assert first == second
+            assert os.stat(second).st_mtime_ns == mtime
+            assert json.loads(open(second).read()) == security._SCAN_CONFIG
+            mock_register.assert_called_once_with(security._remove_scan_config)
+        finally:
+            security._remove_scan_config()
+
+        assert not os.path.exists(first)
+
+    async def test_run_mcp_scan_passes_config_path(self, context):
+        """Test the written config file is handed to mcp-scan as the last argument."""
+        with patch("mcp_validation.validators.security.shutil.which", return_value="/bin/uvx"):
+            validator = SecurityValidator({"enabled": True})
+        process = MagicMock(returncode=0)
+        process.communicate = AsyncMock(return_value=(json.dumps(SCAN_RESULTS).encode(), b""))
+
+        try:
+            with patch("asyncio.create_subprocess_exec", return_value=process) as mock_exec:
+                scan_results, scan_file = await validator._run_mcp_scan(context, [])
+
+            argv = mock_exec.call_args.args
+            assert argv[:2] == ("uvx", "mcp-scan@latest")
+            assert argv[-1] == security._scan_config_path
+            assert scan_results == SCAN_RESULTS
+            assert scan_file is None
+        finally:
+            security._remove_scan_config()
+
+    async def test_run_mcp_scan_failure_keeps_stderr_tail(self, context):
+        """Test a failed scan reports only the decoded tail of stderr."""
+        with patch("mcp_validation.validators.security.shutil.which", return_value="/bin/uvx"):
+            validator = SecurityValidator({"enabled": True})
+        process = MagicMock(returncode=1)
+        process.communicate = AsyncMock(return_value=(b"", b"x" * 8192 + b"\xff boom\n"))
+        warnings = []
+
+        try:
+            with patch("asyncio.create_subprocess_exec", return_value=process):
+                assert await validator._run_mcp_scan(context, warnings) == (None, None)
+        finally:
+            security._remove_scan_config()
+
+        assert len(warnings) == 1
+        assert warnings[0].startswith("mcp-scan failed: ")
+        assert warnings[0].endswith("\ufffd boom")
+        assert len(warnings[0]) < 4200
+
+    def test_parse_scan_results(self):
+        """Test tool and vulnerability extraction from mcp-scan output."""
+        tools_scanned, vulnerabilities, types, levels, max_level = (
+            SecurityValidator()._parse_scan_results(SCAN_RESULTS)
+        )
+
+        assert tools_scanned == 3
+        assert len(vulnerabilities) == 3
+        assert types == ["prompt_injection", "tool_poisoning"]
+        assert levels == ["high", "low", "medium"]
+        assert max_level == 3
+
+    def test_parse_scan_results_critical_max_level(self):
+        """Test severities seen after a critical one still count toward types and levels."""
+        scan_results = {
+            "/tmp/config.json": {
+                "servers": [
+                    {
+                        "signature": {
+                            "tools": [],
+                            "vulnerabilities": [
+                                {"type": "rce", "severity": "CRITICAL"},
+                                {"type": "leak", "severity": "low"},
+                            ],
+                        }
+                    }
+                ]
+            }
+        }
+
+        _, vulnerabilities, types, levels, max_level = SecurityValidator()._parse_scan_results(
+            scan_results
+        )
+
+        assert len(vulnerabilities) == 2
+        assert types == ["rce", "leak"]
+        assert levels == ["CRITICAL", "low"]
+        assert max_level == 4
+
+    async def test_validate_summarizes_vulnerabilities(self, context):
+        """Test validate() aggregates scan results and applies the threshold."""
+        with patch("mcp_validation.validators.security.shutil.which", return_value="/bin/uvx"):
+            validator = SecurityValidator({"enabled": True, "vulnerability_threshold": "high"})
+
+        with patch.object(SecurityValidator, "_run_mcp_scan", return_value=(SCAN_RESULTS, None)):
+            result = await validator.validate(context)
+
+        assert result.passed
+        assert result.data["tools_scanned"] == 3
+        assert result.data["vulnerabilities_found"] == 3
+        assert result.data["vulnerability_types"] == ["prompt_injection", "tool_poisoning"]
+        assert result.data["risk_levels"] == ["high", "low", "medium"]
+        assert "Vulnerabilities found exceed high threshold" in result.warnings
+
+    async def test_validate_below_threshold(self, context):
+        """Test no threshold warning when all vulnerabilities are below it."""
+        with patch("mcp_validation.validators.security.shutil.which", return_value="/bin/uvx"):
+            validator = SecurityValidator({"enabled": True, "vulnerability_threshold": "critical"})
+
+        with patch.object(SecurityValidator, "_run_mcp_scan", return_value=(SCAN_RESULTS, None)):
+            result = await validator.validate(context)
+
+        assert result.warnings == []
@@ -0,0 +1,53 @@
+"""Tests for configuration loading and saving."""
+
+from mcp_validation.config.settings import (
+    ConfigurationManager,
+    ValidationProfile,
+    ValidatorConfig,
+)
+
+
+def test_save_and_load_config_round_trip(tmp_path):
+    """Test custom profiles survive a save/load cycle."""
+    config_file = tmp_path / "config.json"
+    manager = ConfigurationManager()
+    manager.create_profile(
+        ValidationProfile(
+            name="custom",
+            description="Custom profile",
+            validators={"protocol": ValidatorConfig(required=True, timeout=5.0)},
+            parallel_execution=True,
+        )
+    )
+    manager.set_active_profile("custom")
+
+    manager.save_config(str(config_file))
+    loaded = ConfigurationManager(str(config_file))
+
+    assert loaded.active_profile == "custom"
+    profile = loaded.get_active_profile()
+    assert profile.parallel_execution is True
+    assert profile.validators["protocol"].required is True
+    assert profile.validators["protocol"].timeout == 5.0
+
+
+def test_from_dict_matches_file_format():
+    """Test in-memory config data loads the same way as a config file."""
+    manager = ConfigurationManager.from_dict(
+        {
+            "active_profile": "inline",
+            "profiles": {
+                "inline": {
+                    "description": "Inline profile",
+                    "validators": {"registry": {"required": True, "parameters": {"packages": []}}},
+                    "continue_on_failure": False,
+                }
+            },
+        }
+    )
+
+    profile = manager.get_active_profile()
+    assert profile.name == "inline"
+    assert profile.continue_on_failure is False
+    assert profile.validators["registry"].required is True
+    assert "comprehensive" in manager.list_profiles()  # defaults still available
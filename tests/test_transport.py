@@ -0,0 +1,26 @@
+"""Tests for the JSON-RPC transport."""
+
+import pytest
+
+from mcp_validation.core.transport import JSONRPCTransport
+
+
+class TestJSONRPCTransport:
+    """Test cases for JSONRPCTransport response parsing."""
+
+    @pytest.mark.parametrize(
+        "line",
+        [b'{"jsonrpc": "2.0", "id": 1, "result": {}}\n', '{"jsonrpc": "2.0", "id": 1, "result": {}}'],
+    )
+    def test_parse_response_accepts_bytes_and_str(self, line):
+        """Test raw server bytes parse the same as decoded text."""
+        assert JSONRPCTransport(None).parse_response(line) == {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {},
+        }
+
+    def test_parse_response_invalid_raises_value_error(self):
+        """Test malformed lines surface as ValueError."""
+        with pytest.raises(ValueError, match="Invalid JSON response"):
+            JSONRPCTransport(None).parse_response(b"not json\n")
@@ -0,0 +1,57 @@
+"""Tests for ValidationContext."""
+
+import dataclasses
+
+import pytest
+
+from mcp_validation.validators.base import ValidationContext
+
+
+@pytest.fixture
+def context():
+    """Create a validation context without a server process."""
+    return ValidationContext(
+        process=None, server_info={"name": "test-server"}, capabilities={}, timeout=5.0
+    )
+
+
+def test_validation_context_is_slotted(context):
+    """Test the _with_slots rebuild leaves no per-instance __dict__."""
+    assert ValidationContext.__slots__ == tuple(
+        field.name for field in dataclasses.fields(ValidationContext)
+    )
+    assert not hasattr(context, "__dict__")
+
+
+def test_validation_context_is_frozen(context):
+    """Test fields cannot be reassigned while their contents stay mutable."""
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        context.timeout = 1.0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        context.extra = 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del context.timeout
+
+    context.server_info["version"] = "1.0"
+    assert context.server_info == {"name": "test-server", "version": "1.0"}
+
+
+def test_validation_context_hashes_by_identity(context):
+    """Test a per-run context is hashable and only equal to itself."""
+    twin = dataclasses.replace(context)
+
+    assert hash(context) == hash(context)
+    assert context == context
+    assert context != twin
+    assert len({context, twin}) == 2
+
+
+def test_validation_context_replace_and_defaults(context):
+    """Test dataclasses.replace works on the rebuilt class and defaults still apply."""
+    replaced = dataclasses.replace(context, timeout=10.0)
+    other = ValidationContext(process=None, server_info={}, capabilities={})
+
+    assert replaced.timeout == 10.0
+    assert replaced.server_info is context.server_info
+    assert (other.timeout, other.fail_fast, other.fetch_cache) == (30.0, False, {})
+    assert other.fetch_cache is not context.fetch_cache
@@ -0,0 +1,56 @@
+"""Tests for the orchestrator's validator registry."""
+
+from mcp_validation.config.settings import ConfigurationManager
+from mcp_validation.core.validator import MCPValidationOrchestrator
+from mcp_validation.validators.base import BaseValidator, ValidationContext, ValidatorResult
+
+
+class DummyValidator(BaseValidator):
+    """Minimal validator used to exercise custom registration."""
+
+    @property
+    def name(self) -> str:
+        return "dummy"
+
+    @property
+    def description(self) -> str:
+        return "Dummy validator for tests"
+
+    async def validate(self, context: ValidationContext) -> ValidatorResult:
+        return ValidatorResult(
+            validator_name=self.name,
+            passed=True,
+            errors=[],
+            warnings=[],
+            data={},
+            execution_time=0.0,
+        )
+
+
+class TestValidatorRegistry:
+    """Test cases for ValidatorRegistry lookups."""
+
+    def test_builtin_validators_available_after_freeze(self):
+        """Test built-in validators resolve through the frozen lookup table."""
+        orchestrator = MCPValidationOrchestrator(ConfigurationManager())
+
+        assert orchestrator.registry.get_validator("protocol") is not None
+        assert orchestrator.registry.get_validator("registry") is not None
+        assert orchestrator.registry.get_validator("missing") is None
+
+    def test_custom_validator_registered_after_freeze(self):
+        """Test custom registration still works once the registry is frozen."""
+        orchestrator = MCPValidationOrchestrator(ConfigurationManager())
+        orchestrator.register_validator(DummyValidator)
+
+        assert orchestrator.registry.get_validator("dummy") is DummyValidator
+        assert "dummy" in orchestrator.registry.list_validators()
+        assert isinstance(orchestrator.registry.create_validator("dummy"), DummyValidator)
+
+    def test_builtin_validators_are_slotted(self):
+        """Test every built-in validator declares __slots__, so none gets a __dict__."""
+        registry = MCPValidationOrchestrator(ConfigurationManager()).registry
+
+        for name in registry.list_validators():
+            validator = registry.create_validator(name, {})
+            assert not hasattr(validator, "__dict__"), name